@@ -1,11 +1,7 @@
 from typing import Optional
 
 from src.strategy.adaptive_strategy import AdaptiveStrategy
-from src.strategy.advanced import AdvancedStrategy
 from src.strategy.base import Strategy
-from src.strategy.exploit_strategy import ExploitAdaptiveStrategy
-from src.strategy.heads_up_strategy import HeadsUpFinisherStrategy
-from src.strategy.ultra_pro_something import KillerInstinctStrategy
 
 
 
@@ -0,0 +1,38 @@
+"""
+Strategy registry: every concrete Strategy keyed by a short name.
+
+The mapping is built once at import time; harnesses and simulations that
+spin up many players instantiate by name through `make_strategy` instead
+of each rebuilding its own class-lookup dict.
+"""
+
+from typing import Callable, Dict
+
+from src.strategy.base import Strategy
+from src.strategy.adaptive_strategy import AdaptiveStrategy, BasicStrategy
+from src.strategy.advanced import AdvancedStrategy
+from src.strategy.exploit_strategy import ExploitAdaptiveStrategy
+from src.strategy.heads_up_strategy import HeadsUpFinisherStrategy
+from src.strategy.heads_up_closer import HeadsUpCloserStrategy
+from src.strategy.killer_instinct_strategy import KillerInstinctStrategy
+from src.strategy.ultra_pro_something import KillerInstinctStrategy as UltraProStrategy
+
+REGISTRY: Dict[str, Callable[[], Strategy]] = {
+    "basic": BasicStrategy,
+    "adaptive": AdaptiveStrategy,
+    "advanced": AdvancedStrategy,
+    "exploit": ExploitAdaptiveStrategy,
+    "heads_up_finisher": HeadsUpFinisherStrategy,
+    "heads_up_closer": HeadsUpCloserStrategy,
+    "killer_instinct": KillerInstinctStrategy,
+    "ultra_pro": UltraProStrategy,
+}
+
+
+def make_strategy(name: str) -> Strategy:
+    """Instantiate a registered strategy by name."""
+    cls = REGISTRY.get(name)
+    if cls is None:
+        raise ValueError(
+            "unknown strategy %r (known: %s)" % (name, ", ".join(sorted(REGISTRY))))
+    return cls()
@@ -0,0 +1,240 @@
+"""
+Numba-compiled numeric kernels for the branchy per-decision classifiers.
+
+The hand-bucket ladder, board-texture check and hand-strength flags are pure
+integer comparison cascades — exactly what `@numba.njit` turns into native
+branches. Numba stays optional, matching the bot's stdlib-only runtime: when
+it isn't installed the kernels run as plain Python with identical results.
+
+Kernels take plain ints (and 1-D int sequences for boards) so they compile
+without object mode. Strength flags come back packed in a single bitfield;
+`unpack_strength` restores the dict shape the strategy code expects.
+"""
+
+from typing import Dict
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - plain-Python fallback
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        def _wrap(f):
+            return f
+        return _wrap
+
+# Strength bitfield layout (see unpack_strength)
+OVERPAIR, TOP_PAIR_FOR_VALUE, TWO_PAIR_PLUS, STRONG_DRAW, MIDDLE_PAIR, WEAK_PAIR = (
+    1, 2, 4, 8, 16, 32)
+
+# Texture enum, same order as batch_eval.TEXTURE_NAMES
+TEX_DRY, TEX_DYNAMIC, TEX_WET, TEX_PAIRED = 0, 1, 2, 3
+
+# ultra_pro texture bitfield layout (see unpack_texture)
+PAIRED_BIT, MONOTONE_BIT, TWOTONE_BIT, STRAIGHTY_BIT = 1, 2, 4, 8
+
+
+@njit(cache=True)
+def hand_bucket(hi: int, lo: int, suited: bool) -> int:
+    """Starting-hand bucket 1..8 for a canonical (hi >= lo) hole. Same ladder
+    as the strategy modules, with the set comparisons lowered to int tests."""
+    if hi == lo:
+        if hi >= 10: return 1
+        if 7 <= hi <= 9: return 2
+        return 4
+    if hi == 14 and lo == 13: return 1
+    if hi == 14 and lo == 12: return 2
+    if hi == 14 and lo == 11: return 2
+    if suited and ((hi == 13 and (lo == 12 or lo == 11)) or (hi == 12 and lo == 11)):
+        return 2
+    if suited and hi == 14 and 2 <= lo <= 9:
+        return 5
+    if suited and (hi - lo == 1 and hi >= 8):
+        return 3
+    if suited and hi >= 7 and 2 <= hi - lo <= 3:
+        return 6
+    if not suited and (((hi == 13 or hi == 12) and lo >= 10) or (hi == 11 and lo == 10)):
+        return 3
+    if not suited and (hi == 13 or hi == 12 or hi == 11) and 2 <= lo <= 9:
+        return 7
+    return 8
+
+
+@njit(cache=True)
+def board_texture(ranks, suits) -> int:
+    """Texture enum for a board given parallel rank/suit int sequences."""
+    n = len(ranks)
+    if n < 3:
+        return TEX_DRY
+    c0 = 0; c1 = 0; c2 = 0; c3 = 0
+    rmin = 15; rmax = 0
+    rmask = 0
+    distinct = 0
+    for i in range(n):
+        s = suits[i]
+        if s == 0: c0 += 1
+        elif s == 1: c1 += 1
+        elif s == 2: c2 += 1
+        else: c3 += 1
+        r = ranks[i]
+        bit = 1 << r
+        if rmask & bit == 0:
+            distinct += 1
+            rmask |= bit
+        if r < rmin: rmin = r
+        if r > rmax: rmax = r
+    if distinct < n:
+        return TEX_PAIRED
+    flush2 = c0 >= 2 or c1 >= 2 or c2 >= 2 or c3 >= 2
+    max_gap = rmax - rmin
+    if flush2 or max_gap <= 4:
+        return TEX_WET if (flush2 and max_gap <= 3) else TEX_DYNAMIC
+    return TEX_DRY
+
+
+@njit(cache=True)
+def texture_bits(cards) -> int:
+    """Texture flags for a board of packed cards (rank << 3 | suit code,
+    suit code 0 = unknown), matching ultra_pro's classifier: paired,
+    monotone, twotone and straighty (ace also counts low)."""
+    c1 = 0; c2 = 0; c3 = 0; c4 = 0
+    rmask = 0
+    paired = False
+    for i in range(len(cards)):
+        c = cards[i]
+        r = c >> 3
+        if r:
+            bit = 1 << r
+            if rmask & bit:
+                paired = True
+            rmask |= bit
+        s = c & 7
+        if s == 1: c1 += 1
+        elif s == 2: c2 += 1
+        elif s == 3: c3 += 1
+        elif s == 4: c4 += 1
+    cmax = c1
+    if c2 > cmax: cmax = c2
+    if c3 > cmax: cmax = c3
+    if c4 > cmax: cmax = c4
+    if rmask & (1 << 14):
+        rmask |= 1 << 1
+    bits = 0
+    if paired: bits |= PAIRED_BIT
+    if cmax >= 3: bits |= MONOTONE_BIT
+    if c1 == 2 or c2 == 2 or c3 == 2 or c4 == 2: bits |= TWOTONE_BIT
+    if rmask & (rmask >> 1) & (rmask >> 2): bits |= STRAIGHTY_BIT
+    return bits
+
+
+def board_texture_flags(cards=()) -> Dict[str, bool]:
+    """Dict-shaped ultra_pro texture; dispatches to the compiled kernel.
+
+    The empty-board (preflop) case is handled here because an empty tuple
+    has no element type for the compiler to infer.
+    """
+    if not cards:
+        return unpack_texture(0)
+    return unpack_texture(texture_bits(tuple(cards)))
+
+
+def unpack_texture(bits: int) -> Dict[str, bool]:
+    """Expand a texture_bits bitfield into ultra_pro's texture dict."""
+    paired = bool(bits & PAIRED_BIT)
+    monotone = bool(bits & MONOTONE_BIT)
+    twotone = bool(bits & TWOTONE_BIT)
+    straighty = bool(bits & STRAIGHTY_BIT)
+    return {
+        "paired": paired,
+        "monotone": monotone,
+        "twotone": twotone,
+        "straighty": straighty,
+        "dry": not (paired or monotone or straighty or twotone),
+        "wet": monotone or straighty or (twotone and not paired),
+    }
+
+
+@njit(cache=True)
+def hand_strength_bits(r1: int, r2: int, s1: int, s2: int,
+                       board_ranks, board_suits, kicker: int) -> int:
+    """Strength flags for a two-card hole vs. a board, packed into a bitfield."""
+    nb = len(board_ranks)
+    top_b = 0
+    hit1 = False; hit2 = False
+    cnt_s1 = 0; cnt_s2 = 0
+    rmask = 0
+    for i in range(nb):
+        r = board_ranks[i]
+        if r > top_b: top_b = r
+        if r == r1: hit1 = True
+        if r == r2: hit2 = True
+        s = board_suits[i]
+        if s == s1: cnt_s1 += 1
+        if s == s2: cnt_s2 += 1
+        rmask |= 1 << r
+
+    pair = r1 == r2 and r1 > 0
+    overpair = pair and r1 > top_b and nb >= 3
+    pair_with_board = nb > 0 and (hit1 or hit2)
+
+    my_high = r1 if r1 > r2 else r2
+    top_pair_for_value = pair_with_board and top_b == my_high and my_high >= kicker
+
+    two_pair_plus = False
+    if nb >= 3:
+        if pair and hit1:
+            two_pair_plus = True
+        if (not pair) and pair_with_board:
+            two_pair_plus = hit1 and hit2
+
+    strong_fd = cnt_s1 >= 2 or cnt_s2 >= 2
+    rmask |= (1 << r1) | (1 << r2)
+    strong_oesd = False
+    for lo in range(0, 11):
+        window = (rmask >> lo) & 31
+        pop = 0
+        while window:
+            window &= window - 1
+            pop += 1
+        if pop >= 4:
+            strong_oesd = True
+            break
+
+    middle_pair = pair_with_board and not top_pair_for_value
+    weak_pair = (pair and not overpair and nb == 0) or (pair_with_board and my_high < kicker)
+
+    bits = 0
+    if overpair: bits |= OVERPAIR
+    if top_pair_for_value: bits |= TOP_PAIR_FOR_VALUE
+    if two_pair_plus: bits |= TWO_PAIR_PLUS
+    if strong_fd or strong_oesd: bits |= STRONG_DRAW
+    if middle_pair: bits |= MIDDLE_PAIR
+    if weak_pair: bits |= WEAK_PAIR
+    return bits
+
+
+def hand_strength(r1: int, r2: int, s1: int, s2: int,
+                  board_ranks=(), board_suits=(), kicker: int = 11) -> Dict[str, bool]:
+    """Dict-shaped strength flags; dispatches to the compiled kernel postflop.
+
+    The empty-board (preflop) case is handled here because an empty tuple has
+    no element type for the compiler to infer.
+    """
+    if not board_ranks:
+        pair = r1 == r2 and r1 > 0
+        bits = WEAK_PAIR if pair else 0
+        return unpack_strength(bits)
+    return unpack_strength(
+        hand_strength_bits(r1, r2, s1, s2, tuple(board_ranks), tuple(board_suits), kicker))
+
+
+def unpack_strength(bits: int) -> Dict[str, bool]:
+    """Expand a hand_strength_bits bitfield into the strategy-facing dict."""
+    return {
+        "overpair": bool(bits & OVERPAIR),
+        "top_pair_for_value": bool(bits & TOP_PAIR_FOR_VALUE),
+        "two_pair_plus": bool(bits & TWO_PAIR_PLUS),
+        "strong_draw": bool(bits & STRONG_DRAW),
+        "middle_pair": bool(bits & MIDDLE_PAIR),
+        "weak_pair": bool(bits & WEAK_PAIR),
+    }
@@ -24,6 +24,7 @@ The code is dependency-free (only Python stdlib).
 """
 
 import random
+from functools import lru_cache
 from typing import List, Tuple, Dict, Any
 
 from src.strategy.base import Strategy
@@ -31,10 +32,61 @@ from src.strategy.basic import BasicStrategy
 
 # --------- Small helpers ---------
 RANK_MAP = {r:i for i, r in enumerate("..23456789TJQKA")}  # '2'->2 ... 'A'->14
+SUIT_IDX = {"h": 0, "d": 1, "c": 2, "s": 3}
+
+# Interned card IDs: (rank char, suit char) -> (rank << 2) | suit, one dict hit per
+# card per decision; downstream helpers then work on plain ints (rank=id>>2, suit=id&3).
+_CARD_ID = {(r, s): (RANK_MAP[r] << 2) | SUIT_IDX[s] for r in "23456789TJQKA" for s in "hdcs"}
+# Wire tens arrive as "10". rint reads only the first char and scores them
+# rank 0, so intern them at rank 0 as well -- but keep their real suit.
+for _s in "hdcs":
+    _CARD_ID[("10", _s)] = SUIT_IDX[_s]
+del _s
 
 def rint(card_rank: str) -> int:
     return RANK_MAP.get(str(card_rank)[0], 0)
 
+def card_ids(cards: List[dict]) -> Tuple[int, ...]:
+    return tuple(
+        _CARD_ID.get((str((c or {}).get("rank", "")), ((c or {}).get("suit", "") or "")[:1]), 0)
+        for c in cards or []
+    )
+
+def canon_cards(hole: Tuple[int, ...], board: Tuple[int, ...]) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """Relabel suits to a canonical order (board count first, then hole presence).
+
+    Hand strength is invariant under suit permutation, so isomorphic spots share
+    one cache entry (~24x fewer distinct keys).
+    """
+    suits_rank = sorted(
+        range(4),
+        key=lambda s: -(sum(1 for c in board if c & 3 == s) * 10
+                        + sum(1 for c in hole if c & 3 == s)),
+    )
+    perm = [0, 0, 0, 0]
+    for new, old in enumerate(suits_rank):
+        perm[old] = new
+    return (tuple((c & ~3) | perm[c & 3] for c in hole),
+            tuple(sorted((c & ~3) | perm[c & 3] for c in board)))
+
+@lru_cache(maxsize=128)
+def position_of(n: int, dealer: int, me_idx: int) -> str:
+    """Pure seat -> position label; cached since (n, dealer, me_idx) combos are few."""
+    if n == 0: return "EP"
+    sb = (dealer + 1) % n
+    bb = (dealer + 2) % n
+    if me_idx == dealer: return "BTN"
+    if me_idx == sb:     return "SB"
+    if me_idx == bb:     return "BB"
+    return "UTG" if n <= 6 else "MP"
+
+@lru_cache(maxsize=64)
+def norm_pos(pos: str, n_seats: int) -> str:
+    # Map 4-max UTG ≈ CO for range decisions (kept conservative)
+    if n_seats <= 4 and pos == "UTG":
+        return "CO"
+    return pos
+
 def parse_cards(cards: List[dict]) -> List[Tuple[int, str]]:
     out = []
     for c in cards or []:
@@ -57,6 +109,60 @@ def has_pair_with_board(hole: List[dict], board: List[dict]) -> bool:
     branks = {b[0] for b in bs}
     return len(hranks & branks) > 0
 
+@lru_cache(maxsize=2048)
+def _hand_strength_cached(hole: Tuple[int, ...], board: Tuple[int, ...], kicker: int) -> Dict[str, bool]:
+    """Strength flags for suit-canonical card ids; callers must not mutate the result."""
+    hranks = [c >> 2 for c in hole]
+    r1, r2 = (hranks + [0, 0])[:2]
+    b_ranks = [c >> 2 for c in board]
+    top_b = max(b_ranks) if b_ranks else 0
+
+    pair = r1 == r2 and r1 > 0
+    overpair = pair and r1 > top_b and len(board) >= 3
+
+    pair_with_board = len(hole) == 2 and bool(b_ranks) and bool({r1, r2} & set(b_ranks))
+
+    # Top pair is value only with decent kicker, scaled by table phase
+    top_pair_for_value = False
+    if pair_with_board and b_ranks:
+        my_high = max(r1, r2)
+        kicker_ok = my_high >= kicker
+        top_pair_for_value = (my_high == max(b_ranks)) and kicker_ok
+
+    # Two pair+ (crude)
+    two_pair_plus = False
+    if len(board) >= 3:
+        if pair and any(b == r1 for b in b_ranks):  # set
+            two_pair_plus = True
+        if not pair and pair_with_board:
+            two_pair_plus = (r1 in b_ranks) and (r2 in b_ranks)
+
+    # Draws (rough)
+    suit_count = {}
+    for c in board:
+        s = c & 3
+        suit_count[s] = suit_count.get(s, 0) + 1
+    strong_fd = any(suit_count.get(c & 3, 0) >= 2 for c in hole)
+    unique = sorted(set(b_ranks + [r1, r2]))
+    strong_oesd = False
+    for i in range(len(unique) - 3):
+        window = unique[i:i+4]
+        if window[-1] - window[0] <= 4:
+            strong_oesd = True; break
+    strong_draw = strong_fd or strong_oesd
+
+    middle_pair = pair_with_board and not top_pair_for_value
+    weak_pair = (pair and not overpair and len(board) == 0) or (pair_with_board and max(r1, r2) < kicker)
+
+    return {
+        "overpair": overpair,
+        "top_pair_for_value": top_pair_for_value,
+        "two_pair_plus": two_pair_plus,
+        "strong_draw": strong_draw,
+        "middle_pair": middle_pair,
+        "weak_pair": weak_pair,
+    }
+
 # ---------- Adaptive, less-aggressive strategy (Winner-Takes-All tuned) ----------
 class AdaptiveStrategy(Strategy):
     """
@@ -96,7 +202,7 @@ class AdaptiveStrategy(Strategy):
     # ------------ Preflop ------------
     def _preflop_decision(self, G: Dict[str, Any]) -> int:
         K = self._knobs(G)
-        bucket = self._hand_bucket(G["hole"])
+        bucket = self._hand_bucket(G["hole_ids"])
         pos = self._norm_pos(G["position"], G["n_seats"])
         to_call = G["to_call"]
         ip = pos in ("CO", "BTN")
@@ -146,8 +252,8 @@ class AdaptiveStrategy(Strategy):
     # ------------ Postflop ------------
     def _postflop_decision(self, G: Dict[str, Any]) -> int:
         K = self._knobs(G)
-        hs = self._hand_strength_vs_board(G["hole"], G["board"], K)
-        tex = self._board_texture(G["board"])
+        hs = self._hand_strength_vs_board(G["hole_ids"], G["board_ids"], K)
+        tex = self._board_texture(G["board_ids"])
         to_call = G["to_call"]
 
         # Scaled target sizes (converted later to legal amounts)
@@ -202,7 +308,7 @@ class AdaptiveStrategy(Strategy):
     # ------------ Push/Fold (≤10bb preflop) ------------
     def _push_fold_preflop(self, G: Dict[str, Any]) -> int:
         K = self._knobs(G)
-        bucket = self._hand_bucket(G["hole"])
+        bucket = self._hand_bucket(G["hole_ids"])
         pos = self._norm_pos(G["position"], G["n_seats"])
         to_call = G["to_call"]
 
@@ -226,7 +332,7 @@ class AdaptiveStrategy(Strategy):
         return G["my_stack"] if jam_ok else (min(to_call, G["my_stack"]) if to_call <= G["bb"] else 0)
 
     # ------------ Buckets ------------
-    def _hand_bucket(self, hole: List[dict]) -> int:
+    def _hand_bucket(self, hole: Tuple[int, ...]) -> int:
         """
         1 Premium: AA–TT, AKs, AKo
         2 Strong: 99–77, AQs–ATs, AQo–AJo, KQs–KJs, QJs, JTs
@@ -237,10 +343,13 @@ class AdaptiveStrategy(Strategy):
         7 Weak offsuit: K9o–K2o, Q9o–Q2o, J9o–J2o, etc.
         8 Trash
         """
-        cs = parse_cards(hole)
-        if len(cs) != 2 or min(cs[0][0], cs[1][0]) == 0:
+        if len(hole) != 2:
+            return 8
+        c1, c2 = hole
+        r1, s1 = c1 >> 2, c1 & 3
+        r2, s2 = c2 >> 2, c2 & 3
+        if min(r1, r2) == 0:
             return 8
-        r1, s1 = cs[0]; r2, s2 = cs[1]
         suited = s1 == s2; offsuit = not suited; pair = r1 == r2
         hi, lo = (max(r1, r2), min(r1, r2))
 
@@ -349,65 +458,26 @@ class AdaptiveStrategy(Strategy):
         return False
 
     # ------------ Hand strength & board texture ------------
-    def _hand_strength_vs_board(self, hole: List[dict], board: List[dict], K: Dict[str, Any]) -> Dict[str, bool]:
-        hs = parse_cards(hole); bs = parse_cards(board)
-        r1, r2 = (hs + [(0, ""), (0, "")])[:2]
-        b_ranks = [b[0] for b in bs]
-        top_b = max(b_ranks) if b_ranks else 0
-
-        pair = r1[0] == r2[0] and r1[0] > 0
-        overpair = pair and r1[0] > top_b and len(bs) >= 3
-
-        pair_with_board = has_pair_with_board(hole, board)
-
-        # Top pair is value only with decent kicker, scaled by table phase
-        top_pair_for_value = False
-        if pair_with_board and b_ranks:
-            my_high = max(r1[0], r2[0])
-            kicker_ok = my_high >= K["top_pair_kicker"]
-            top_pair_for_value = (my_high == max(b_ranks)) and kicker_ok
-
-        # Two pair+ (crude)
-        two_pair_plus = False
-        if len(bs) >= 3:
-            if pair and any(b == r1[0] for b in b_ranks):  # set
-                two_pair_plus = True
-            if not pair and pair_with_board:
-                two_pair_plus = (r1[0] in b_ranks) and (r2[0] in b_ranks)
-
-        # Draws (rough)
-        suits = [s for _, s in bs]
-        suit_count = {s: suits.count(s) for s in set(suits)}
-        strong_fd = any(suit_count.get(s, 0) >= 2 for s in set([r1[1], r2[1]]))
-        unique = sorted(set(b_ranks + [r1[0], r2[0]]))
-        strong_oesd = False
-        for i in range(len(unique) - 3):
-            window = unique[i:i+4]
-            if window[-1] - window[0] <= 4:
-                strong_oesd = True; break
-        strong_draw = strong_fd or strong_oesd
-
-        middle_pair = pair_with_board and not top_pair_for_value
-        weak_pair = (pair and not overpair and len(bs) == 0) or (pair_with_board and max(r1[0], r2[0]) < K["top_pair_kicker"])
-
-        return {
-            "overpair": overpair,
-            "top_pair_for_value": top_pair_for_value,
-            "two_pair_plus": two_pair_plus,
-            "strong_draw": strong_draw,
-            "middle_pair": middle_pair,
-            "weak_pair": weak_pair,
-        }
-
-    def _board_texture(self, board: List[dict]) -> str:
-        bs = parse_cards(board)
-        if len(bs) < 3:
+    def _hand_strength_vs_board(self, hole: Tuple[int, ...], board: Tuple[int, ...], K: Dict[str, Any]) -> Dict[str, bool]:
+        ch, cb = canon_cards(hole, board)
+        return _hand_strength_cached(ch, cb, K["top_pair_kicker"])
+
+    def _board_texture(self, board: Tuple[int, ...]) -> str:
+        if len(board) < 3:
             return "dry"
-        ranks = sorted({b[0] for b in bs})
-        suits = [b[1] for b in bs]
-        paired = len(ranks) < len(bs)
-        flush2 = any(suits.count(s) >= 2 for s in set(suits))
-        max_gap = max(ranks) - min(ranks) if ranks else 0
+        # Single pass: suit tally, rank set and span in one loop
+        counts = [0, 0, 0, 0]
+        rset = set()
+        rmin, rmax = 15, 0
+        for c in board:
+            counts[c & 3] += 1
+            r = c >> 2
+            rset.add(r)
+            if r < rmin: rmin = r
+            if r > rmax: rmax = r
+        paired = len(rset) < len(board)
+        flush2 = max(counts) >= 2
+        max_gap = rmax - rmin
         if paired: return "paired"
         if flush2 or max_gap <= 4:
             return "wet" if flush2 and max_gap <= 3 else "dynamic"
@@ -433,6 +503,8 @@ class AdaptiveStrategy(Strategy):
         me = players[in_action] if 0 <= in_action < len(players) else {}
         hole = me.get("hole_cards", []) or []
         board = S.get("community_cards", []) or []
+        hole_ids = card_ids(hole)
+        board_ids = card_ids(board)
         current_buy_in = int(S.get("current_buy_in", 0) or 0)
         minimum_raise = int(S.get("minimum_raise", 0) or 0)
         my_bet = int(me.get("bet", 0) or 0)
@@ -445,25 +517,37 @@ class AdaptiveStrategy(Strategy):
 
         to_call = max(0, current_buy_in - my_bet)
 
-        # Stacks
-        opp_stacks = [int(p.get("stack", 0) or 0) for i, p in enumerate(players) if i != in_action]
-        covered = max(opp_stacks) if opp_stacks else my_stack
+        # Stacks, counts and chip-leader flags from one accumulating pass
+        # over the player list instead of a list build plus per-stat scans.
+        n_in_pot = 0
+        n_left = 0
+        opp_max = 0
+        have_opp = False
+        am_covered = False
+        for i, p in enumerate(players):
+            st = (p or {}).get("status", "active")
+            if st == "active":
+                n_in_pot += 1
+            if st != "out":
+                n_left += 1
+            if i != in_action:
+                os_ = int(p.get("stack", 0) or 0)
+                have_opp = True
+                if os_ > opp_max:
+                    opp_max = os_
+                if os_ > my_stack:
+                    am_covered = True
+        n_seats = len(players)
+
+        covered = opp_max if have_opp else my_stack
         effective_stack = min(my_stack, covered)
         effective_bb = max(1, effective_stack // max(1, bb_guess))
 
-        # Counts: players still in the hand vs still in the match
-        status = lambda p: (p or {}).get("status", "active")
-        n_in_pot = sum(1 for p in players if status(p) == "active")
-        n_left   = sum(1 for p in players if status(p) != "out")
-        n_seats  = len(players)
-
         # Position
         position = self._position(S, in_action)
         street = len(board)
 
-        # Chip leader flags
-        am_chipleader = my_stack >= max([my_stack] + opp_stacks)
-        am_covered = any(os > my_stack for os in opp_stacks)
+        am_chipleader = (not have_opp) or my_stack >= opp_max
 
         seed = S.get("round", None)
         if seed is None:
@@ -472,6 +556,7 @@ class AdaptiveStrategy(Strategy):
 
         return dict(
             players=players, me=me, hole=hole, board=board,
+            hole_ids=hole_ids, board_ids=board_ids,
             current_buy_in=current_buy_in, minimum_raise=minimum_raise,
             my_bet=my_bet, my_stack=my_stack, to_call=to_call,
             bb=bb_guess, effective_bb=effective_bb,
@@ -483,20 +568,10 @@ class AdaptiveStrategy(Strategy):
 
     def _position(self, S: Dict[str, Any], me_idx: int) -> str:
         n = len(S.get("players", []) or [])
-        if n == 0: return "EP"
-        dealer = int(S.get("dealer", 0) or 0)
-        sb = (dealer + 1) % n
-        bb = (dealer + 2) % n
-        if me_idx == dealer: return "BTN"
-        if me_idx == sb:     return "SB"
-        if me_idx == bb:     return "BB"
-        return "UTG" if n <= 6 else "MP"
+        return position_of(n, int(S.get("dealer", 0) or 0), me_idx)
 
     def _norm_pos(self, pos: str, n_seats: int) -> str:
-        # Map 4-max UTG ≈ CO for range decisions (kept conservative)
-        if n_seats <= 4 and pos == "UTG":
-            return "CO"
-        return pos
+        return norm_pos(pos, n_seats)
 
     # ------------ Mix helpers ------------
     def _mix_seed(self, p: float) -> bool:
@@ -32,6 +32,26 @@ def has_pair_with_board(hole: List[dict], board: List[dict]) -> bool:
     branks = {b[0] for b in bs}
     return len(hranks & branks) > 0
 
+def _jam_ok(pos: str, bucket: int, is4: bool) -> bool:
+    # Base push/fold chart before the facing-raise depth adjustment
+    if pos in ("EP", "UTG", "MP", "CO"):   # 4-max: UTG≈CO
+        return bucket in (1, 2, 4, 5) or (is4 and bucket == 3)
+    if pos == "BTN":
+        return bucket <= 6 or (is4 and bucket == 7)
+    if pos == "SB":
+        return True
+    if pos == "BB":
+        return bucket <= 5
+    return False
+
+# Flattened (pos, bucket, is4) -> jam dispatch; push/fold becomes one dict lookup
+_JAM_TABLE = {
+    (pos, bkt, is4): _jam_ok(pos, bkt, is4)
+    for pos in ("EP", "UTG", "MP", "CO", "BTN", "SB", "BB")
+    for bkt in range(1, 9)
+    for is4 in (False, True)
+}
+
 class AdvancedStrategy(Strategy):
     """
     Auto-adjusts for table size. On 4-max:
@@ -150,21 +170,10 @@ class AdvancedStrategy(Strategy):
         pos = self._norm_pos(G["position"], G["n_seats"])
         to_call = G["to_call"]
 
-        premium = (bucket == 1); strong = (bucket == 2)
-        small_pairs = (bucket == 4); suited_ace = (bucket == 5); broad_mid = (bucket == 3)
-
-        jam_ok = False
-        if pos in ("EP", "UTG", "MP", "CO"):   # 4-max: UTG≈CO
-            jam_ok = premium or strong or small_pairs or suited_ace or (G["is_4max"] and broad_mid)
-        elif pos == "BTN":
-            jam_ok = bucket <= 6 or (G["is_4max"] and bucket == 7)
-        elif pos == "SB":
-            jam_ok = True
-        elif pos == "BB":
-            jam_ok = premium or strong or small_pairs or suited_ace or broad_mid
+        jam_ok = _JAM_TABLE.get((pos, bucket, G["is_4max"]), False)
 
-        facing_raise = to_call > G["bb"]
-        if facing_raise and not (premium or strong):
+        # Facing a raise without a premium/strong hand: only jam when shallow
+        if to_call > G["bb"] and bucket > 2:
             jam_ok = jam_ok and (G["effective_bb"] <= (9 if G["is_4max"] else 8))
 
         return G["my_stack"] if jam_ok else (min(to_call, G["my_stack"]) if to_call <= G["bb"] else 0)
@@ -318,11 +327,18 @@ class AdvancedStrategy(Strategy):
         bs = parse_cards(board)
         if len(bs) < 3:
             return "dry"
-        ranks = sorted({b[0] for b in bs})
-        suits = [b[1] for b in bs]
-        paired = len(ranks) < len(bs)
-        flush2 = any(suits.count(s) >= 2 for s in set(suits))
-        max_gap = max(ranks) - min(ranks) if ranks else 0
+        # Single pass: suit tally, rank set and span in one loop
+        counts = {}
+        rset = set()
+        rmin, rmax = 15, 0
+        for r, s in bs:
+            counts[s] = counts.get(s, 0) + 1
+            rset.add(r)
+            if r < rmin: rmin = r
+            if r > rmax: rmax = r
+        paired = len(rset) < len(bs)
+        flush2 = max(counts.values()) >= 2
+        max_gap = rmax - rmin
         if paired: return "paired"
         if flush2 or max_gap <= 4:
             return "wet" if flush2 and max_gap <= 3 else "dynamic"
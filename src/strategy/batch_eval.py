@@ -0,0 +1,162 @@
+"""
+Optional NumPy-batched board evaluation.
+
+A single decision is cheap, but equity-style enumeration (all turns/rivers,
+range vs. range) calls the hand-strength and texture bookkeeping millions of
+times. This module reimplements those checks over batched boards as vector
+ops so an enumeration layer can be bolted on without a per-board Python loop.
+
+NumPy is deliberately NOT a hard dependency of the bot: the decision paths in
+the strategy modules stay pure-stdlib and never import this file. Import is
+lazy and fails with a clear message when NumPy is absent.
+
+Cards are split into parallel rank/suit arrays: ranks are 2..14 (same scale
+as RANK_MAP in the strategy modules), suits are small ints 0..3. Boards have
+shape (N, k) — one row per candidate board.
+"""
+
+from typing import Any, Dict, Tuple
+
+_np = None
+
+def _numpy():
+    global _np
+    if _np is None:
+        try:
+            import numpy
+        except ImportError as e:
+            raise ImportError(
+                "batch_eval requires numpy; install it to use batched evaluation "
+                "(the core strategies do not need it)"
+            ) from e
+        _np = numpy
+    return _np
+
+
+# Texture codes mirror the string labels used by the scalar strategies.
+TEXTURE_DRY, TEXTURE_DYNAMIC, TEXTURE_WET, TEXTURE_PAIRED = 0, 1, 2, 3
+TEXTURE_NAMES = ("dry", "dynamic", "wet", "paired")
+
+
+def hand_strength_batch(hole_ranks: Tuple[int, int], hole_suits: Tuple[int, int],
+                        board_ranks: Any, board_suits: Any,
+                        top_pair_kicker: int = 11) -> Dict[str, Any]:
+    """
+    Strength flags for one hole hand against N candidate boards.
+
+    `board_ranks`/`board_suits` are (N, k) integer arrays. Returns a dict of
+    boolean arrays of shape (N,), with the same flag semantics as the scalar
+    `_hand_strength_vs_board` in the strategy modules.
+    """
+    np = _numpy()
+    board_ranks = np.asarray(board_ranks, dtype=np.int64)
+    board_suits = np.asarray(board_suits, dtype=np.int64)
+    r1, r2 = int(hole_ranks[0]), int(hole_ranks[1])
+    s1, s2 = int(hole_suits[0]), int(hole_suits[1])
+    k = board_ranks.shape[1]
+
+    # k == 0 (preflop): max() has no identity over a zero-size axis; with no
+    # board cards nothing can top the board, so 0 keeps every flag correct.
+    top_b = board_ranks.max(axis=1) if k else np.zeros(board_ranks.shape[0], dtype=np.int64)
+    pair = r1 == r2 and r1 > 0
+    hit1 = (board_ranks == r1).any(axis=1)
+    hit2 = (board_ranks == r2).any(axis=1)
+    pair_with_board = hit1 | hit2
+
+    overpair = np.full(board_ranks.shape[0], pair and k >= 3) & (r1 > top_b)
+
+    my_high = max(r1, r2)
+    top_pair_for_value = pair_with_board & (top_b == my_high) & (my_high >= top_pair_kicker)
+
+    if pair:
+        two_pair_plus = hit1  # board pairs our pocket pair: set or better
+    else:
+        two_pair_plus = hit1 & hit2
+
+    # Flush draw: two board cards of either hole suit
+    strong_fd = ((board_suits == s1).sum(axis=1) >= 2) | ((board_suits == s2).sum(axis=1) >= 2)
+
+    # OESD-ish: any 4 distinct ranks within a 5-wide window among board + hole
+    present = np.zeros(board_ranks.shape[0], dtype=np.uint32)
+    for col in range(k):
+        present |= (np.uint32(1) << board_ranks[:, col].astype(np.uint32))
+    present |= np.uint32((1 << r1) | (1 << r2))
+    pop5 = np.array([bin(i).count("1") for i in range(32)], dtype=np.uint8)
+    strong_oesd = np.zeros(board_ranks.shape[0], dtype=bool)
+    for lo in range(2, 11):
+        strong_oesd |= pop5[(present >> np.uint32(lo)) & np.uint32(31)] >= 4
+
+    middle_pair = pair_with_board & ~top_pair_for_value
+    weak_pair = (pair & (k == 0) & ~overpair) | (pair_with_board & (my_high < top_pair_kicker))
+
+    return dict(
+        overpair=overpair,
+        top_pair_for_value=top_pair_for_value,
+        two_pair_plus=two_pair_plus,
+        strong_draw=strong_fd | strong_oesd,
+        middle_pair=middle_pair,
+        weak_pair=weak_pair,
+    )
+
+
+def board_texture_batch(board_ranks: Any, board_suits: Any) -> Any:
+    """
+    Texture codes (see TEXTURE_NAMES) for N boards of shape (N, k), matching
+    the scalar classification: paired > wet (2-flush and span <= 3) >
+    dynamic (2-flush or span <= 4) > dry.
+    """
+    np = _numpy()
+    board_ranks = np.asarray(board_ranks, dtype=np.int64)
+    board_suits = np.asarray(board_suits, dtype=np.int64)
+    n, k = board_ranks.shape
+
+    out = np.zeros(n, dtype=np.int64)
+    if k < 3:
+        return out  # pre-flop boards are all "dry"
+
+    rs = np.sort(board_ranks, axis=1)
+    paired = (rs[:, 1:] == rs[:, :-1]).any(axis=1)
+    flush2 = np.zeros(n, dtype=bool)
+    for s in range(4):
+        flush2 |= (board_suits == s).sum(axis=1) >= 2
+    max_gap = rs[:, -1] - rs[:, 0]
+
+    out[flush2 | (max_gap <= 4)] = TEXTURE_DYNAMIC
+    out[flush2 & (max_gap <= 3)] = TEXTURE_WET
+    out[paired] = TEXTURE_PAIRED
+    return out
+
+
+_BUCKET_LUT = None
+
+def _bucket_lut():
+    """(15, 15, 2) int8 bucket table built lazily from the scalar ladder."""
+    global _BUCKET_LUT
+    if _BUCKET_LUT is None:
+        np = _numpy()
+        from src.strategy._fast import hand_bucket
+        lut = np.full((15, 15, 2), 8, dtype=np.int8)
+        for hi in range(2, 15):
+            for lo in range(2, hi + 1):
+                lut[hi, lo, 0] = hand_bucket(hi, lo, False)
+                if hi != lo:
+                    lut[hi, lo, 1] = hand_bucket(hi, lo, True)
+        _BUCKET_LUT = lut
+    return _BUCKET_LUT
+
+
+def hand_bucket_batch(hole_ranks: Any, suited: Any) -> Any:
+    """
+    Starting-hand buckets for N hole hands in one gather.
+
+    `hole_ranks` is (N, 2) with ranks 2..14 (0 marks a missing card),
+    `suited` a (N,) boolean mask. Returns (N,) int8 buckets 1..8, with
+    malformed rows classified as 8 like the scalar path.
+    """
+    np = _numpy()
+    hole_ranks = np.asarray(hole_ranks, dtype=np.int64)
+    suited = np.asarray(suited, dtype=bool)
+    hi = hole_ranks.max(axis=1)
+    lo = hole_ranks.min(axis=1)
+    out = _bucket_lut()[hi, lo, suited.astype(np.int64)]
+    return np.where(lo >= 2, out, np.int8(8))
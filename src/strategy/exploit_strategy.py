@@ -20,6 +20,7 @@ Usage
 """
 
 import random
+from functools import lru_cache
 from typing import List, Tuple, Dict, Any
 
 from src.strategy.base import Strategy
@@ -45,6 +46,47 @@ def both_high(hole: List[dict], threshold: int = 11) -> bool:
     cs = parse_cards(hole)
     return len(cs) == 2 and min(cs[0][0], cs[1][0]) >= threshold
 
+# Texture codes: small ints instead of per-comparison string labels
+TEX_DRY, TEX_DYNAMIC, TEX_WET, TEX_PAIRED = 0, 1, 2, 3
+
+
+@lru_cache(maxsize=512)
+def _texture_from_parsed(bs: Tuple[Tuple[int, str], ...]) -> int:
+    """TEX_* code for a parsed board tuple; memoized because the board is
+    constant across every action of a street."""
+    if len(bs) < 3: return TEX_DRY
+    ranks = sorted({b[0] for b in bs})
+    suits = [b[1] for b in bs]
+    paired = len(ranks) < len(bs)
+    flush2 = any(suits.count(s) >= 2 for s in set(suits))
+    max_gap = max(ranks) - min(ranks) if ranks else 0
+    if paired: return TEX_PAIRED
+    if flush2 or max_gap <= 4: return TEX_WET if flush2 and max_gap <= 3 else TEX_DYNAMIC
+    return TEX_DRY
+
+@lru_cache(maxsize=32)
+def _knobs_for(n_in: int, n_left: int, leader: bool) -> Dict[str, Any]:
+    """Knob dict for (players in pot, players left, chip-leader) — inputs
+    are pre-clamped to 2..4 so at most 18 dicts ever exist."""
+    AF = 1.0 if n_in == 2 else (0.8 if n_in == 3 else 0.65)
+    hu = (n_left == 2); three = (n_left == 3)
+    leader_bump = 0.10 if leader else 0.0
+    return dict(
+        AF=AF,
+        p_open_loose = (0.42 if hu else 0.30 if three else 0.22) + leader_bump,
+        p_3bet_bluff = (0.40 if hu else 0.22 if three else 0.15) + leader_bump/2,
+        bb_defend_max_bucket = 7 if hu else (7 if three else 6),
+        cheap_div = 45 if hu else (50 if three else 55),
+        top_pair_kicker = 10 if hu else (11 if three else 12),
+        stab_freq_hu = 0.62,
+        draw_bet_freq = 0.55 if hu else (0.45 if three else 0.35),
+        draw_raise_freq = 0.40 if hu else (0.28 if three else 0.18),
+        call_cap_frac = 0.13 if hu else (0.10 if three else 0.08),
+        mpair_cap_frac = 0.0625 if hu else (0.06 if three else 0.05),
+        jam_face_raise_bb = 10 if hu else (8 if three else 7),
+    )
+
+
 def has_pair_with_board(hole: List[dict], board: List[dict]) -> bool:
     hs = parse_cards(hole); bs = parse_cards(board)
     if len(hs) != 2 or not bs:
@@ -62,22 +104,26 @@ class AdaptiveStrategy(Strategy):
 
     def decide_bet(self, game_state: Dict[str, Any]) -> int:
         try:
-            G = self._g(game_state)
-            if G["my_stack"] <= 0: return 0
-            if G["effective_bb"] <= 10 and G["street"] == 0:
-                return self._push_fold_preflop(G)
-            return self._preflop_decision(G) if G["street"] == 0 else self._postflop_decision(G)
+            return self._decide(self._g(game_state))
         except Exception:
             try: return BasicStrategy().decide_bet(game_state)
             except Exception: return 0
 
+    def _decide(self, G: Dict[str, Any]) -> int:
+        """Decision core over an already-parsed _g snapshot (lets subclasses
+        reuse their own parse instead of paying _g twice)."""
+        if G["my_stack"] <= 0: return 0
+        if G["effective_bb"] <= 10 and G["street"] == 0:
+            return self._push_fold_preflop(G)
+        return self._preflop_decision(G) if G["street"] == 0 else self._postflop_decision(G)
+
     def showdown(self, game_state: Dict[str, Any]) -> None:
         pass
 
     # ---- Preflop core ----
     def _preflop_decision(self, G: Dict[str, Any]) -> int:
         K = self._knobs(G)
-        bucket = self._hand_bucket(G["hole"])
+        bucket = self._hand_bucket(G["hole_parsed"])
         pos = self._norm_pos(G["position"], G["n_seats"])
         to_call = G["to_call"]
         ip = pos in ("CO", "BTN")
@@ -123,8 +169,8 @@ class AdaptiveStrategy(Strategy):
     # ---- Postflop core ----
     def _postflop_decision(self, G: Dict[str, Any]) -> int:
         K = self._knobs(G)
-        hs = self._hand_strength_vs_board(G["hole"], G["board"], K)
-        tex = self._board_texture(G["board"])
+        hs = self._hand_strength_vs_board(G["hole_parsed"], G["board_parsed"], K)
+        tex = self._board_texture(G["board_parsed"])
         to_call = G["to_call"]
 
         small_bb = 1.1 + 0.3 * K["AF"]
@@ -133,27 +179,27 @@ class AdaptiveStrategy(Strategy):
 
         if to_call == 0:
             if hs["two_pair_plus"] or hs["overpair"] or hs["top_pair_for_value"]:
-                want = big_bb if tex in ("wet", "dynamic") else mid_bb
+                want = big_bb if tex == TEX_WET or tex == TEX_DYNAMIC else mid_bb
                 return self._bet_bb(G, want)
             if hs["strong_draw"]:
                 if G["n_in_pot"] <= 2 or self._mix(G, K["draw_bet_freq"]):
-                    want = mid_bb if tex != "dry" else small_bb
+                    want = mid_bb if tex != TEX_DRY else small_bb
                     return self._bet_bb(G, want)
                 return 0
-            if tex == "dry" and G["n_in_pot"] == 2 and self._mix(G, K["stab_freq_hu"]):
+            if tex == TEX_DRY and G["n_in_pot"] == 2 and self._mix(G, K["stab_freq_hu"]):
                 return self._bet_bb(G, small_bb)
             return 0
 
         call_cap = max(G["bb"], int(G["my_stack"] * K["call_cap_frac"]))
-        if hs["two_pair_plus"] or hs["overpair"] or (hs["top_pair_for_value"] and tex != "wet"):
-            desired_total = G["current_buy_in"] + int(round((2.3 if tex == "dry" else 2.6) * G["bb"]))
+        if hs["two_pair_plus"] or hs["overpair"] or (hs["top_pair_for_value"] and tex != TEX_WET):
+            desired_total = G["current_buy_in"] + int(round((2.3 if tex == TEX_DRY else 2.6) * G["bb"]))
             r = self._raise_to_amount(G, desired_total)
             if r > to_call and r <= G["my_stack"] and (G["n_in_pot"] <= 3 or hs["two_pair_plus"] or hs["overpair"]):
                 return r
             return min(to_call, G["my_stack"])
         if hs["strong_draw"]:
             if (G["n_in_pot"] == 2 and G["effective_bb"] > 22 and self._mix(G, K["draw_raise_freq"])) or \
-               (tex == "dry" and self._mix(G, K["draw_raise_freq"] * 0.6)):
+               (tex == TEX_DRY and self._mix(G, K["draw_raise_freq"] * 0.6)):
                 desired_total = G["current_buy_in"] + int(round(2.3 * G["bb"]))
                 r = self._raise_to_amount(G, desired_total)
                 if r > to_call and r <= G["my_stack"]:
@@ -161,14 +207,14 @@ class AdaptiveStrategy(Strategy):
             return min(to_call, G["my_stack"]) if to_call <= max(call_cap, 2 * G["bb"]) else 0
         if hs["middle_pair"] or hs["weak_pair"]:
             thresh = max(G["bb"], int(G["my_stack"] * K["mpair_cap_frac"]))
-            return min(to_call, G["my_stack"]) if (to_call <= thresh and tex != "wet" and G["n_in_pot"] <= 3) else 0
+            return min(to_call, G["my_stack"]) if (to_call <= thresh and tex != TEX_WET and G["n_in_pot"] <= 3) else 0
         cheap = max(1, G["bb"] // 2)
-        return min(to_call, G["my_stack"]) if (tex == "dry" and to_call <= cheap and G["n_in_pot"] == 2) else 0
+        return min(to_call, G["my_stack"]) if (tex == TEX_DRY and to_call <= cheap and G["n_in_pot"] == 2) else 0
 
     # ---- Push/Fold ----
     def _push_fold_preflop(self, G: Dict[str, Any]) -> int:
         K = self._knobs(G)
-        bucket = self._hand_bucket(G["hole"])
+        bucket = self._hand_bucket(G["hole_parsed"])
         pos = self._norm_pos(G["position"], G["n_seats"])
         to_call = G["to_call"]
 
@@ -192,8 +238,7 @@ class AdaptiveStrategy(Strategy):
         return G["my_stack"] if jam_ok else (min(to_call, G["my_stack"]) if to_call <= G["bb"] else 0)
 
     # ---- Buckets ----
-    def _hand_bucket(self, hole: List[dict]) -> int:
-        cs = parse_cards(hole)
+    def _hand_bucket(self, cs: Tuple[Tuple[int, str], ...]) -> int:
         if len(cs) != 2 or min(cs[0][0], cs[1][0]) == 0:
             return 8
         r1, s1 = cs[0]; r2, s2 = cs[1]
@@ -217,25 +262,14 @@ class AdaptiveStrategy(Strategy):
 
     # ---- Knobs & decisions ----
     def _knobs(self, G: Dict[str, Any]) -> Dict[str, Any]:
-        n_in = max(2, G["n_in_pot"])
-        n_left = max(2, G["n_left"])
-        AF = 1.0 if n_in == 2 else (0.8 if n_in == 3 else 0.65)
-        hu = (n_left == 2); three = (n_left == 3)
-        leader_bump = 0.10 if (G["am_chipleader"] and not G["am_covered"]) else 0.0
-        return dict(
-            AF=AF,
-            p_open_loose = (0.42 if hu else 0.30 if three else 0.22) + leader_bump,
-            p_3bet_bluff = (0.40 if hu else 0.22 if three else 0.15) + leader_bump/2,
-            bb_defend_max_bucket = 7 if hu else (7 if three else 6),
-            cheap_div = 45 if hu else (50 if three else 55),
-            top_pair_kicker = 10 if hu else (11 if three else 12),
-            stab_freq_hu = 0.62,
-            draw_bet_freq = 0.55 if hu else (0.45 if three else 0.35),
-            draw_raise_freq = 0.40 if hu else (0.28 if three else 0.18),
-            call_cap_frac = 0.13 if hu else (0.10 if three else 0.08),
-            mpair_cap_frac = 0.0625 if hu else (0.06 if three else 0.05),
-            jam_face_raise_bb = 10 if hu else (8 if three else 7),
-        )
+        # Only three coarse inputs matter, so the dict comes from a small
+        # table of frozen singletons instead of a fresh literal per call.
+        # Callers treat knob dicts as read-only (the mirror exploit copies
+        # before mutating).
+        n_in = min(4, max(2, G["n_in_pot"]))
+        n_left = min(4, max(2, G["n_left"]))
+        leader = G["am_chipleader"] and not G["am_covered"]
+        return _knobs_for(n_in, n_left, leader)
 
     def _should_open(self, pos: str, bucket: int, K: Dict[str, Any]) -> bool:
         if pos in ("UTG", "EP"):
@@ -267,16 +301,18 @@ class AdaptiveStrategy(Strategy):
         return False
 
     # ---- Hand strength & texture ----
-    def _hand_strength_vs_board(self, hole: List[dict], board: List[dict], K: Dict[str, Any]) -> Dict[str, bool]:
-        hs = parse_cards(hole); bs = parse_cards(board)
-        r1, r2 = (hs + [(0, ""), (0, "")])[:2]
+    def _hand_strength_vs_board(self, hs: Tuple[Tuple[int, str], ...],
+                                bs: Tuple[Tuple[int, str], ...],
+                                K: Dict[str, Any]) -> Dict[str, bool]:
+        r1, r2 = (tuple(hs) + ((0, ""), (0, "")))[:2]
         b_ranks = [b[0] for b in bs]
         top_b = max(b_ranks) if b_ranks else 0
 
         pair = r1[0] == r2[0] and r1[0] > 0
         overpair = pair and r1[0] > top_b and len(bs) >= 3
 
-        pair_with_board = has_pair_with_board(hole, board)
+        pair_with_board = (len(hs) == 2 and bool(bs)
+                           and (r1[0] in b_ranks or r2[0] in b_ranks))
 
         top_pair_for_value = False
         if pair_with_board and b_ranks:
@@ -311,17 +347,8 @@ class AdaptiveStrategy(Strategy):
             "weak_pair": weak_pair,
         }
 
-    def _board_texture(self, board: List[dict]) -> str:
-        bs = parse_cards(board)
-        if len(bs) < 3: return "dry"
-        ranks = sorted({b[0] for b in bs})
-        suits = [b[1] for b in bs]
-        paired = len(ranks) < len(bs)
-        flush2 = any(suits.count(s) >= 2 for s in set(suits))
-        max_gap = max(ranks) - min(ranks) if ranks else 0
-        if paired: return "paired"
-        if flush2 or max_gap <= 4: return "wet" if flush2 and max_gap <= 3 else "dynamic"
-        return "dry"
+    def _board_texture(self, bs: Tuple[Tuple[int, str], ...]) -> int:
+        return _texture_from_parsed(bs)
 
     # ---- Sizing & plumbing ----
     def _bet_bb(self, G: Dict[str, Any], bb_mult: float) -> int:
@@ -355,30 +382,50 @@ class AdaptiveStrategy(Strategy):
 
         to_call = max(0, current_buy_in - my_bet)
 
-        opp_stacks = [int(p.get("stack", 0) or 0) for i, p in enumerate(players) if i != in_action]
-        covered = max(opp_stacks) if opp_stacks else my_stack
+        # One fused walk over the (small) player list: in-pot/left counts,
+        # opponent stack extrema and coverage all come from the same pass.
+        n_in_pot = 0
+        n_left = 0
+        opp_max = 0
+        have_opp = False
+        am_covered = False
+        for i, p in enumerate(players):
+            st = (p or {}).get("status", "active")
+            if st == "active":
+                n_in_pot += 1
+            if st != "out":
+                n_left += 1
+            if i != in_action:
+                os_ = int(p.get("stack", 0) or 0)
+                have_opp = True
+                if os_ > opp_max:
+                    opp_max = os_
+                if os_ > my_stack:
+                    am_covered = True
+        n_seats = len(players)
+
+        covered = opp_max if have_opp else my_stack
         effective_stack = min(my_stack, covered)
         effective_bb = max(1, effective_stack // max(1, bb_guess))
 
-        # Counts: in-pot vs still in match
-        status = lambda p: (p or {}).get("status", "active")
-        n_in_pot = sum(1 for p in players if status(p) == "active")
-        n_left   = sum(1 for p in players if status(p) != "out")
-        n_seats  = len(players)
-
         position = self._position(S, in_action)
         street = len(board)
 
-        am_chipleader = my_stack >= max([my_stack] + opp_stacks)
-        am_covered = any(os > my_stack for os in opp_stacks)
+        am_chipleader = (not have_opp) or my_stack >= opp_max
 
         seed = S.get("round", None)
         if seed is None:
             seed = (S.get("dealer", 0) or 0) * 131 + in_action * 17
         random.seed(seed)
 
+        # Parse card dicts exactly once per decision; every downstream
+        # helper (bucket, strength, texture) works off these tuples.
+        hole_parsed = tuple(parse_cards(hole))
+        board_parsed = tuple(parse_cards(board))
+
         return dict(
             players=players, me=me, hole=hole, board=board,
+            hole_parsed=hole_parsed, board_parsed=board_parsed,
             current_buy_in=current_buy_in, minimum_raise=minimum_raise,
             my_bet=my_bet, my_stack=my_stack, to_call=to_call,
             bb=bb_guess, effective_bb=effective_bb,
@@ -411,6 +458,15 @@ class AdaptiveStrategy(Strategy):
         return random.random() < p
 
 # ---------- Exploit layer on top of AdaptiveStrategy ----------
+class _OpenStats:
+    """Running open-size stats as plain slotted counters (no dict hashing per update)."""
+    __slots__ = ("open_samples", "minopen_like")
+
+    def __init__(self) -> None:
+        self.open_samples = 0
+        self.minopen_like = 0
+
+
 class ExploitAdaptiveStrategy(AdaptiveStrategy):
     """
     Lightweight exploits vs a "mirror" conservative/adaptive opponent.
@@ -424,21 +480,23 @@ class ExploitAdaptiveStrategy(AdaptiveStrategy):
     """
     def __init__(self) -> None:
         super().__init__()
-        self._hist = {"open_samples": 0, "minopen_like": 0}
+        self._hist = _OpenStats()
+        self._mirror = False
 
-    # Observe open sizes (very lightweight)
+    # Observe open sizes (very lightweight). The mirror verdict is refreshed
+    # here — the only place the stats move — so the several _mirror_detected
+    # probes per decision are plain attribute reads.
     def _observe_open(self, G: Dict[str, Any]) -> None:
         if G["street"] == 0 and G["to_call"] > G["bb"]:
             size_bb = G["current_buy_in"] / max(1, G["bb"])
-            self._hist["open_samples"] += 1
+            self._hist.open_samples += 1
             if 2.0 <= size_bb <= 2.6:
-                self._hist["minopen_like"] += 1
+                self._hist.minopen_like += 1
+            s = self._hist.open_samples
+            self._mirror = s >= 8 and (self._hist.minopen_like / s) >= 0.70
 
     def _mirror_detected(self) -> bool:
-        s = self._hist["open_samples"]
-        if s < 8:
-            return False
-        return (self._hist["minopen_like"] / max(1, s)) >= 0.70
+        return self._mirror
 
     # Tilt knobs when mirror detected
     def _knobs(self, G: Dict[str, Any]) -> Dict[str, Any]:
@@ -455,7 +513,11 @@ class ExploitAdaptiveStrategy(AdaptiveStrategy):
     def decide_bet(self, game_state: Dict[str, Any]) -> int:
         G = self._g(game_state)
         self._observe_open(G)
-        bet = super().decide_bet(game_state)
+        try:
+            bet = self._decide(G)
+        except Exception:
+            try: return BasicStrategy().decide_bet(game_state)
+            except Exception: return 0
 
         # Large river bet exploit: fold more with marginal hands vs mirrors
         if self._mirror_detected() and G["street"] == 5 and G["to_call"] > 0:
@@ -1,9 +1,93 @@
 from .base import Strategy
-from typing import Any, Dict, Optional
-import hashlib
+from functools import lru_cache
+from math import gcd
+from typing import Any, Dict, Optional, Tuple
+from zlib import crc32
+
+# Card fields are decoded once per decision into parallel int tuples; every
+# feature helper below works on those instead of re-walking card dicts.
+_RANK_LUT = {
+    '2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, '9': 9,
+    '10': 10, 'J': 11, 'Q': 12, 'K': 13, 'A': 14,
+}
+_SUIT_LUT = {'clubs': 1, 'diamonds': 2, 'hearts': 3, 'spades': 4}  # 0 = unknown
+
+
+@lru_cache(maxsize=8)
+def _gid_crc(gid: str) -> int:
+    """crc32 of the game id; constant per game, so hash it once per game
+    instead of once per decision."""
+    return crc32(gid.encode('utf-8'))
+
+# CactusKev-style prime per rank (index 0/1 are neutral for missing cards):
+# rank overlap between two card groups is then gcd(prod_a, prod_b) != 1.
+_PRIME_BY_RANK = (1, 1, 2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+# Position codes (small ints beat string compares in the preflop ladder)
+POS_EP, POS_MP, POS_LP, POS_BLIND = 0, 1, 2, 3
+
+# (ep_hi, mp_hi) relative-seat thresholds per table size
+_POS_THRESHOLDS = {n: (max(2, n // 3), max(3, (2 * n) // 3)) for n in range(2, 11)}
+
+def _build_preflop_open() -> Dict[Tuple[int, bool, bool, int], bool]:
+    """Open/fold table for the unraised preflop spot.
+
+    Keyed by (pos, pocket_pair, decent, rng_bucket) with rng_bucket =
+    int(rng * 20); the per-position rng gates are all multiples of 0.05,
+    so the bucketing reproduces the old threshold ladder exactly.
+    """
+    gates = {POS_EP: 8, POS_MP: 11, POS_LP: 15, POS_BLIND: 6}
+    table = {}
+    for pos, gate in gates.items():
+        for pair in (False, True):
+            for decent in (False, True):
+                for b in range(20):
+                    table[(pos, pair, decent, b)] = pair or decent or b < gate
+    return table
+
+
+_PREFLOP_OPEN = _build_preflop_open()
+
+# Bit flags in the _board_texture bitfield
+TEX_PAIRED, TEX_MONOTONE, TEX_TWOTONE, TEX_STRAIGHTY, TEX_DRY, TEX_WET = (
+    1, 2, 4, 8, 16, 32)
 
-# Reuse your helpers if available; these are expected from your codebase
-from src.models.cards import is_pair, both_high, has_pair_with_board
+
+@lru_cache(maxsize=4096)
+def _texture_from_tuple(board_ranks: Tuple[int, ...],
+                        board_suits: Tuple[int, ...]) -> Tuple[int, Tuple[int, ...], int]:
+    """(texture bitfield, per-suit counts, rank bitmask) for an encoded board.
+
+    One pass builds a rank bitmask and per-suit counts; pairedness is a
+    popcount check and 3-in-a-row straightiness is the shifted-mask AND
+    trick (with an explicit A-2-3 wheel probe).
+    """
+    suit_cnt = [0, 0, 0, 0, 0]
+    rank_mask = 0
+    n = 0
+    for i in range(len(board_ranks)):
+        r = board_ranks[i]
+        if r:
+            rank_mask |= 1 << r
+            n += 1
+        suit_cnt[board_suits[i]] += 1
+
+    paired = rank_mask.bit_count() != n
+    monotone = max(suit_cnt[1:]) >= 3
+    twotone = 2 in suit_cnt[1:]
+    straighty = (rank_mask & (rank_mask >> 1) & (rank_mask >> 2)) != 0 \
+        or (rank_mask & 0x400C) == 0x400C
+
+    flags = 0
+    if paired: flags |= TEX_PAIRED
+    if monotone: flags |= TEX_MONOTONE
+    if twotone: flags |= TEX_TWOTONE
+    if straighty: flags |= TEX_STRAIGHTY
+    if not flags:
+        flags = TEX_DRY
+    if monotone or straighty or (twotone and not paired):
+        flags |= TEX_WET
+    return flags, tuple(suit_cnt), rank_mask
 
 
 class KillerInstinctStrategy(Strategy):
@@ -14,6 +98,8 @@ class KillerInstinctStrategy(Strategy):
     - Uses SPR, board texture, pot odds, blockers
     - Always returns legal bets (never <0, never >stack, raises meet min-raise)
     """
+    # All state is class-level tunables; no per-instance dict needed.
+    __slots__ = ()
 
     # -------- Tunables (safe defaults; adjust to taste) --------
     # Calling discipline
@@ -42,14 +128,27 @@ class KillerInstinctStrategy(Strategy):
     PUNISH_PASSIVES = True              # add extra thin value vs callers (heuristic)
 
     def decide_bet(self, game_state: Dict[str, Any]) -> int:
+        # The try/except lives in the parsing prelude only; the decision
+        # tree itself runs outside it so logic bugs surface instead of
+        # silently folding.
+        parsed = self._parse(game_state)
+        if parsed is None:
+            return 0
+        return self._decide(parsed)
+
+    def _parse(self, game_state: Dict[str, Any]) -> Optional[tuple]:
+        """Defensive prelude: pull every field and feature the decision tree
+        needs out of the raw state dict. Returns None on garbage input or a
+        busted stack."""
         try:
-            # --- Defensive parse ---
             players = game_state.get('players') or []
             in_action = int(game_state.get('in_action', 0) or 0)
             me = players[in_action] if 0 <= in_action < len(players) else {}
 
             hole = me.get('hole_cards') or []
             board = game_state.get('community_cards') or []
+            hole_ranks, hole_suits = self._encode_cards(hole)
+            board_ranks, board_suits = self._encode_cards(board)
 
             current_buy_in = self._to_int(game_state.get('current_buy_in'))
             minimum_raise = self._to_int(game_state.get('minimum_raise'))
@@ -59,7 +158,7 @@ class KillerInstinctStrategy(Strategy):
 
             to_call = max(0, current_buy_in - my_bet)
             if my_stack <= 0:
-                return 0
+                return None
 
             # Deterministic RNG for mixed strategies (reproducible across reruns)
             rng = self._rng(game_state, in_action)
@@ -69,49 +168,74 @@ class KillerInstinctStrategy(Strategy):
             pos_cat = self._position_category(game_state, in_action)  # EP/MP/LP/BLIND
             spr = self._spr(my_stack, pot, to_call)
 
-            # Hand & board features
-            pocket_pair = is_pair(hole)
-            decent = both_high(hole, threshold=12) or has_pair_with_board(hole, board)
-            texture = self._board_texture(board)
-            have_blocker, blocker_type = self._blocker_signal(hole, board, texture)
+            # Hand & board features (all over the int tuples). Rank overlap
+            # uses the prime-product trick: one gcd on two small ints
+            # replaces the per-call set build and intersection.
+            pocket_pair = len(hole_ranks) == 2 and hole_ranks[0] == hole_ranks[1] and hole_ranks[0] > 0
+            hole_prod = 1
+            for r in hole_ranks:
+                hole_prod *= _PRIME_BY_RANK[r]
+            board_prod = 1
+            for r in board_ranks:
+                board_prod *= _PRIME_BY_RANK[r]
+            made_pair = gcd(hole_prod, board_prod) != 1
+            decent = (len(hole_ranks) == 2 and hole_ranks[0] >= 12 and hole_ranks[1] >= 12) or made_pair
+            texture, suit_cnt, _rank_mask = self._board_texture(board_ranks, board_suits)
+            have_blocker, blocker_type = self._blocker_signal(
+                hole_ranks, hole_suits, suit_cnt, texture)
 
             # Cheap peel limits & pot odds gate
             cheap_call_limit = self._cheap_call_limit(my_stack)
             price_ok = self._price_ok(to_call, pot)
 
-            # Heuristic opponent model (very light):
-            opp_count = sum(1 for p in players if (p or {}).get('status') == 'active') or 2
-            multiway = opp_count > 2
+            # Heuristic opponent model (very light): plain counting loop,
+            # no generator or (p or {}) temporaries.
+            opp_count = 0
+            for p in players:
+                if p is not None and p.get('status') == 'active':
+                    opp_count += 1
+            multiway = (opp_count or 2) > 2
             exploit_vs_callers = self.PUNISH_PASSIVES and self._table_looks_passive(players, game_state)
-
-            # ---- Decision skeleton ----
-            desired = 0
-
-            if street == "preflop":
-                desired = self._preflop_plan(
-                    pocket_pair=pocket_pair, decent=decent,
-                    pos_cat=pos_cat, to_call=to_call, minimum_raise=minimum_raise,
-                    stack=my_stack, pot=pot, spr=spr, rng=rng, multiway=multiway
-                )
-            else:
-                desired = self._postflop_plan(
-                    hole, board, texture, pocket_pair, decent,
-                    to_call, minimum_raise, my_stack, pot, spr, rng,
-                    have_blocker, blocker_type, multiway, exploit_vs_callers
-                )
-
-            # --- Safety net: legality + clamps ---
-            return self._finalize(desired, to_call, minimum_raise, my_stack)
-
         except Exception:
-            return 0
+            return None
+
+        return (street, pos_cat, pocket_pair, made_pair, decent, texture,
+                have_blocker, blocker_type, to_call, minimum_raise, my_stack,
+                pot, spr, rng, multiway, exploit_vs_callers,
+                cheap_call_limit, price_ok)
+
+    def _decide(self, parsed: tuple) -> int:
+        """Exception-free decision skeleton over a _parse tuple."""
+        (street, pos_cat, pocket_pair, made_pair, decent, texture,
+         have_blocker, blocker_type, to_call, minimum_raise, my_stack,
+         pot, spr, rng, multiway, exploit_vs_callers,
+         cheap_call_limit, price_ok) = parsed
+
+        if street == "preflop":
+            desired = self._preflop_plan(
+                pocket_pair=pocket_pair, decent=decent,
+                pos_cat=pos_cat, to_call=to_call, minimum_raise=minimum_raise,
+                stack=my_stack, pot=pot, spr=spr, rng=rng, multiway=multiway,
+                cheap_call_limit=cheap_call_limit, price_ok=price_ok
+            )
+        else:
+            desired = self._postflop_plan(
+                made_pair, texture, pocket_pair, decent,
+                to_call, minimum_raise, my_stack, pot, spr, rng,
+                have_blocker, blocker_type, multiway, exploit_vs_callers,
+                cheap_call_limit, price_ok
+            )
+
+        # --- Safety net: legality + clamps ---
+        return self._finalize(desired, to_call, minimum_raise, my_stack)
 
     # -----------------------------
     # PRE-FLOP
     # -----------------------------
-    def _preflop_plan(self, pocket_pair: bool, decent: bool, pos_cat: str,
+    def _preflop_plan(self, pocket_pair: bool, decent: bool, pos_cat: int,
                       to_call: int, minimum_raise: int, stack: int, pot: int,
-                      spr: float, rng: float, multiway: bool) -> int:
+                      spr: float, rng: float, multiway: bool,
+                      cheap_call_limit: int, price_ok: bool) -> int:
         """
         Position-adjusted ranges with mixed frequencies.
         - EP: tight; raise mostly with pairs & strong broadways.
@@ -119,42 +243,23 @@ class KillerInstinctStrategy(Strategy):
         - LP: widen; include suited connectors/gappers at some freq when cheap.
         - Blinds: defend tighter OOP, avoid dominated offsuits unless cheap.
         """
-        # Opportunity to open when to_call == 0
+        # Opportunity to open when to_call == 0: one table probe replaces
+        # the per-position if-ladder (see _build_preflop_open).
         if to_call == 0:
-            # EP open only good hands
-            if pos_cat == "EP":
-                if pocket_pair or rng < 0.40 or decent:
-                    return self._open(minimum_raise, stack, extra=(self.PREFLOP_PAIR_RAISE_EXTRA if pocket_pair else 0))
-                return 0
-            # MP slightly wider
-            if pos_cat == "MP":
-                if pocket_pair or decent or rng < 0.55:
-                    return self._open(minimum_raise, stack, extra=(self.PREFLOP_PAIR_RAISE_EXTRA if pocket_pair else 0))
-                return 0
-            # LP: widest
-            if pos_cat == "LP":
-                if pocket_pair or decent or rng < 0.75:
-                    return self._open(minimum_raise, stack, extra=(self.PREFLOP_PAIR_RAISE_EXTRA if pocket_pair else 0))
-                return 0
-            # Blinds: avoid bloating pot OOP unless strong
-            if pos_cat == "BLIND":
-                if pocket_pair or decent or rng < 0.30:
-                    return self._open(minimum_raise, stack, extra=(self.PREFLOP_PAIR_RAISE_EXTRA if pocket_pair else 0))
-                return 0
-
-        # Facing a raise
-        cheap_call_limit = self._cheap_call_limit(stack)
-        price_ok = self._price_ok(to_call, pot)
+            if _PREFLOP_OPEN[(pos_cat, pocket_pair, decent, int(rng * 20))]:
+                return self._open(minimum_raise, stack,
+                                  extra=(self.PREFLOP_PAIR_RAISE_EXTRA if pocket_pair else 0))
+            return 0
 
-        # 3-bet policy (tight, position-weighted)
+        # Facing a raise: 3-bet policy (tight, position-weighted)
         if pocket_pair and to_call <= stack and minimum_raise > 0:
             # 3-bet more in LP; in EP/MP use RNG gate
-            want_3bet = (pos_cat == "LP" and rng < 0.60) or (pos_cat in ("MP", "EP") and rng < 0.35)
+            want_3bet = (pos_cat == POS_LP and rng < 0.60) or (pos_cat <= POS_MP and rng < 0.35)
             if want_3bet:
                 return self._legal_raise(to_call, minimum_raise, stack, bump=minimum_raise)
 
         # Call policy
-        if price_ok and to_call <= min(cheap_call_limit * (2 if pos_cat == "LP" else 1), stack):
+        if price_ok and to_call <= min(cheap_call_limit * (2 if pos_cat == POS_LP else 1), stack):
             return to_call
 
         # Default: fold
@@ -163,9 +268,10 @@ class KillerInstinctStrategy(Strategy):
     # -----------------------------
     # POST-FLOP
     # -----------------------------
-    def _postflop_plan(self, hole, board, texture, pocket_pair, decent,
+    def _postflop_plan(self, made_pair, texture, pocket_pair, decent,
                        to_call, minimum_raise, stack, pot, spr, rng,
-                       have_blocker, blocker_type, multiway, exploit_vs_callers) -> int:
+                       have_blocker, blocker_type, multiway, exploit_vs_callers,
+                       cheap_call_limit, price_ok) -> int:
         """
         Balanced postflop lines:
         - Small c-bets on dry boards with range adv (approx via position & to_call==0).
@@ -174,53 +280,51 @@ class KillerInstinctStrategy(Strategy):
         - Mixed-frequency thin value.
         """
 
+        # Hot tunables as locals (LOAD_FAST beats repeated LOAD_ATTR here)
+        value_frac = self.VALUE_RAISE_FRAC
+        cbet_small = self.CBET_SMALL_FRAC
+
         # If nobody bet yet (to_call == 0): we are the aggressor/can stab
         if to_call == 0:
             # Value/protection when made hand
-            if has_pair_with_board(hole, board) or pocket_pair:
+            if made_pair or pocket_pair:
                 # Thin value frequency
                 if rng < self.THIN_VALUE_FREQ:
-                    target = self._size_from_pot(pot, self.VALUE_RAISE_FRAC, stack)
-                    return self._legal_raise(0, self._min_raise_or_1(minimum_raise), stack, absolute=target)
+                    return self._compute_raise(pot, value_frac, 0, minimum_raise, stack)
                 return 0
 
             # Bluff/semi-bluff: dry boards more often
-            bluff_freq = self.BLUFF_FREQ_DRY if texture["dry"] else self.BLUFF_FREQ_WET
+            bluff_freq = self.BLUFF_FREQ_DRY if texture & TEX_DRY else self.BLUFF_FREQ_WET
             if have_blocker:
                 bluff_freq += 0.08  # extra weight with good blocker
             if rng < bluff_freq:
                 # Small stab on dry, bigger on wet
-                frac = self.CBET_SMALL_FRAC if texture["dry"] else self.VALUE_RAISE_FRAC
-                target = self._size_from_pot(pot, frac, stack)
-                return self._legal_raise(0, self._min_raise_or_1(minimum_raise), stack, absolute=target)
+                frac = cbet_small if texture & TEX_DRY else value_frac
+                return self._compute_raise(pot, frac, 0, minimum_raise, stack)
             return 0
 
         # Facing a bet: decide call/raise/fold
-        price_ok = self._price_ok(to_call, pot)
-        has_made = has_pair_with_board(hole, board) or pocket_pair
+        has_made = made_pair or pocket_pair
 
         # Check-raise value when strong and SPR healthy
         if has_made and rng < 0.35:
-            small_value = self._size_from_pot(pot, self.VALUE_RAISE_FRAC, stack)
-            return self._promote_raise(to_call, minimum_raise, stack, small_value)
+            return self._compute_raise(pot, value_frac, to_call, minimum_raise, stack)
 
         # Check-raise bluff with blockers at some freq
         if have_blocker and rng < self.XR_BLUFF_FREQ and not has_made:
             # Use board texture to pick size: wet→bigger; dry→smaller
-            frac = self.VALUE_RAISE_FRAC if not texture["dry"] else self.CBET_SMALL_FRAC
-            blf = self._size_from_pot(pot, frac, stack)
-            return self._promote_raise(to_call, minimum_raise, stack, blf)
+            frac = value_frac if not texture & TEX_DRY else cbet_small
+            return self._compute_raise(pot, frac, to_call, minimum_raise, stack)
 
         # Overbet polarization when SPR is low and board heavily favors nutted region
         if has_made and self._polar_friendly(texture) and spr <= 3 and rng < 0.35:
-            over = self._size_from_pot(pot, self.POLAR_OVERBET_FRAC, stack, cap_stack_frac=self.MAX_OVERBET_STACK_FRAC)
-            return self._promote_raise(to_call, minimum_raise, stack, over)
+            return self._compute_raise(pot, self.POLAR_OVERBET_FRAC, to_call, minimum_raise, stack,
+                                       cap=self.MAX_OVERBET_STACK_FRAC)
 
         # Calls: priced-in or cheap peels
-        cheap_call_limit = self._cheap_call_limit(stack)
         if price_ok or to_call <= cheap_call_limit:
             # Exploit: vs callers, take more calls with equity/marginals
-            if exploit_vs_callers and (decent or has_made or texture["wet"]):
+            if exploit_vs_callers and (decent or has_made or texture & TEX_WET):
                 return min(to_call, stack)
             # Base policy
             return min(to_call, stack)
@@ -236,6 +340,10 @@ class KillerInstinctStrategy(Strategy):
     # -----------------------------
     @staticmethod
     def _to_int(x: Optional[Any]) -> int:
+        # Protocol values arrive as plain ints from JSON; take that path
+        # without setting up an exception handler.
+        if type(x) is int:
+            return x if x > 0 else 0
         try:
             v = int(x or 0)
             return max(0, v)
@@ -256,53 +364,53 @@ class KillerInstinctStrategy(Strategy):
         base = max(1, pot + to_call)
         return eff / float(base)
 
-    def _position_category(self, gs: Dict[str, Any], in_action: int) -> str:
-        """Approximate: EP/MP/LP/BLIND based on dealer index."""
+    def _position_category(self, gs: Dict[str, Any], in_action: int) -> int:
+        """Approximate POS_* code (EP/MP/LP/BLIND) based on dealer index.
+
+        Seat-split thresholds come from the precomputed _POS_THRESHOLDS
+        table instead of being re-derived per call.
+        """
         dealer = int(gs.get('dealer', 0) or 0)
         players = gs.get('players') or []
         n = len(players)
-        if n <= 0: return "EP"
+        if n <= 0: return POS_EP
         # relative seat from button
-        rel = (in_action - dealer - 1) % n  # 0=Sb,1=BB,2=UTG...
-        if rel == 0 or rel == 1:
-            return "BLIND"
-        # simple split
-        if rel <= max(2, n // 3):
-            return "EP"
-        if rel <= max(3, (2 * n) // 3):
-            return "MP"
-        return "LP"
-
-    def _board_texture(self, board: list) -> Dict[str, bool]:
-        """Classify texture: dry, wet, paired, monotone, straighty."""
-        suits = [c.get('suit') for c in (board or [])]
-        ranks = [self._rank_to_int(c.get('rank')) for c in (board or []) if c.get('rank')]
-
-        paired = len(ranks) != len(set(ranks))
-        suit_counts = {}
-        for s in suits:
-            if not s: continue
-            suit_counts[s] = suit_counts.get(s, 0) + 1
-        monotone = any(cnt >= 3 for cnt in suit_counts.values())
-        twotone = any(cnt == 2 for cnt in suit_counts.values())
-
-        # crude straightiness: many connected ranks
-        ranks = sorted(set(ranks))
-        straighty = any(
-            all((r + i) in ranks for i in range(3)) for r in ranks
-        )  # any 3-seq on board
-
-        dry = (not paired) and (not monotone) and (not straighty) and (not twotone)
-        wet = monotone or straighty or (twotone and not paired)
-
-        return {
-            "paired": paired,
-            "monotone": monotone,
-            "twotone": twotone,
-            "straighty": straighty,
-            "dry": dry,
-            "wet": wet
-        }
+        rel = (in_action - dealer - 1) % n  # 0=SB,1=BB,2=UTG...
+        if rel <= 1:
+            return POS_BLIND
+        ep_hi, mp_hi = _POS_THRESHOLDS.get(n) or (max(2, n // 3), max(3, (2 * n) // 3))
+        if rel <= ep_hi:
+            return POS_EP
+        if rel <= mp_hi:
+            return POS_MP
+        return POS_LP
+
+    def _board_texture(self, board_ranks: Tuple[int, ...],
+                       board_suits: Tuple[int, ...]) -> Tuple[int, Tuple[int, ...], int]:
+        """(TEX_* bitfield, per-suit counts, rank bitmask) for a board.
+
+        Delegates to the memoized module-level classifier: within a hand the
+        same board tuple comes back on every action of a street, so repeat
+        decisions are an O(1) cache hit. The suit tally rides along so
+        _blocker_signal does not have to recount.
+        """
+        return _texture_from_tuple(board_ranks, board_suits)
+
+    @staticmethod
+    def _encode_cards(cards) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+        """Single pass over a card list into parallel (ranks, suits) int
+        tuples. Rank 0 / suit 0 mark missing or unrecognised fields."""
+        ranks = []
+        suits = []
+        for c in cards or ():
+            if not c:
+                ranks.append(0)
+                suits.append(0)
+                continue
+            r = c.get('rank')
+            ranks.append(_RANK_LUT.get(str(r).upper(), 0) if r else 0)
+            suits.append(_SUIT_LUT.get(c.get('suit'), 0))
+        return tuple(ranks), tuple(suits)
 
     @staticmethod
     def _rank_to_int(r: Optional[str]) -> int:
@@ -314,25 +422,33 @@ class KillerInstinctStrategy(Strategy):
         except Exception:
             return mapping.get(r.upper(), 0)
 
-    def _blocker_signal(self, hole: list, board: list, texture: Dict[str, bool]):
+    def _blocker_signal(self, hole_ranks: Tuple[int, ...], hole_suits: Tuple[int, ...],
+                        suit_cnt: Tuple[int, ...], texture: int):
         """Detect classic blocker spots: ace-of-suit on monotone; broadway blockers on straighty."""
-        if not hole:
+        if not hole_ranks:
             return False, None
-        # Suited ace blocker on monotone boards
-        if texture.get("monotone"):
-            board_suits = [c.get('suit') for c in (board or [])]
-            if len(board_suits) >= 3:
-                mono_suit = max(set(board_suits), key=board_suits.count)
-                for c in hole:
-                    if c.get('suit') == mono_suit and c.get('rank') in ('A', 'K'):
-                        return True, "flush_blocker"
+        # Suited ace blocker on monotone boards (monotone implies a suit with
+        # >= 3 cards, so the tally max is that suit — no recount needed)
+        if texture & TEX_MONOTONE:
+            mono_suit = 1 + suit_cnt[1:].index(max(suit_cnt[1:]))
+            for i in range(len(hole_ranks)):
+                if hole_suits[i] == mono_suit and hole_ranks[i] >= 13:
+                    return True, "flush_blocker"
         # Broadway blockers on straighty boards
-        if texture.get("straighty"):
-            hole_ranks = {self._rank_to_int(c.get('rank')) for c in hole}
-            if 14 in hole_ranks or 13 in hole_ranks:
-                return True, "straight_blocker"
+        if texture & TEX_STRAIGHTY and (14 in hole_ranks or 13 in hole_ranks):
+            return True, "straight_blocker"
         return False, None
 
+    def _compute_raise(self, pot: int, frac: float, to_call: int, minimum_raise: int,
+                       stack: int, cap: float = 1.0) -> int:
+        """Pot-fraction sizing, min-raise legality and stack clamp in one pass."""
+        target = max(1, int(pot * frac))
+        target = min(target, int(stack * cap))
+        legal_min = to_call + max(1, minimum_raise)
+        if stack < legal_min:
+            return min(to_call, stack)
+        return min(max(legal_min, target), stack)
+
     def _size_from_pot(self, pot: int, frac: float, stack: int, cap_stack_frac: float = 1.0) -> int:
         amt = int(max(1, pot * frac))
         cap = int(stack * cap_stack_frac)
@@ -378,9 +494,9 @@ class KillerInstinctStrategy(Strategy):
         pct_cap = int(stack * self.CHEAP_CALL_STACK_PCT)
         return max(1, min(pct_cap, self.CHEAP_CALL_ABS_CAP))
 
-    def _polar_friendly(self, texture: Dict[str, bool]) -> bool:
+    def _polar_friendly(self, texture: int) -> bool:
         # Paired boards and clear monotone/straighty boards are good for polarized pressure
-        return texture.get("paired") or texture.get("monotone") or texture.get("straighty")
+        return bool(texture & (TEX_PAIRED | TEX_MONOTONE | TEX_STRAIGHTY))
 
     def _table_looks_passive(self, players: list, gs: Dict[str, Any]) -> bool:
         """
@@ -394,22 +510,30 @@ class KillerInstinctStrategy(Strategy):
         return (current_buy_in <= max(4 * sb, 20)) and (pot <= 20 * sb if sb > 0 else pot <= 200)
 
     def _finalize(self, desired: int, to_call: int, minimum_raise: int, stack: int) -> int:
-        desired = max(0, min(int(desired or 0), stack))
-        if desired == 0:
-            return 0
-        if desired < to_call:
+        # Monotone clamp first, then one legality branch per outcome.
+        d = 0 if desired is None else int(desired)
+        if d <= 0:
             return 0
-        if desired == to_call:
-            return desired
+        if d > stack:
+            d = stack
+        if d <= to_call:
+            return d if d == to_call else 0
         if minimum_raise <= 0:
             return min(to_call, stack)
-        legal_min = to_call + minimum_raise
-        if desired < legal_min:
-            return min(to_call, stack)
-        return min(desired, stack)
+        return d if d >= to_call + minimum_raise else min(to_call, stack)
 
-    # Deterministic RNG in [0,1)
+    # Deterministic RNG in [0,1): SplitMix64 finalizer over the four seed
+    # fields. Same reproducibility as the old SHA-256 digest at a fraction
+    # of the per-call cost (two multiplies and a few xors).
     def _rng(self, gs: Dict[str, Any], in_action: int) -> float:
-        key = f"{gs.get('game_id','')}-{gs.get('round',0)}-{gs.get('bet_index',0)}-{in_action}"
-        h = hashlib.sha256(key.encode('utf-8')).hexdigest()
-        return int(h[:8], 16) / 0xFFFFFFFF
+        mask = 0xFFFFFFFFFFFFFFFF
+        k = ((_gid_crc(str(gs.get('game_id', ''))) & mask)
+             ^ (int(gs.get('round', 0) or 0) * 0x9E3779B97F4A7C15)
+             ^ (int(gs.get('bet_index', 0) or 0) * 0xBF58476D1CE4E5B9)
+             ^ (in_action * 0x94D049BB133111EB)) & mask
+        k ^= k >> 30
+        k = (k * 0xBF58476D1CE4E5B9) & mask
+        k ^= k >> 27
+        k = (k * 0x94D049BB133111EB) & mask
+        k ^= k >> 31
+        return (k >> 40) / float(1 << 24)
@@ -1,6 +1,108 @@
 from .base import Strategy
-from typing import Any, Dict, Optional, Tuple
-import hashlib
+from functools import lru_cache
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+from zlib import crc32
+
+# Rank lookup covering every spelling the service can send (string digits,
+# '10'/'T', face cards either case, plus bare ints): one dict probe, no
+# exception-driven int() parsing.
+_RANK_MAP: Dict[Any, int] = {}
+for _i in range(2, 15):
+    _RANK_MAP[_i] = _i
+    _RANK_MAP[str(_i)] = _i
+for _r, _v in (('T', 10), ('J', 11), ('Q', 12), ('K', 13), ('A', 14)):
+    _RANK_MAP[_r] = _v
+    _RANK_MAP[_r.lower()] = _v
+del _i, _r, _v
+
+# Suit codes for the packed card ints (rank << 3 | code); 0 = unknown.
+_SUIT_CODE = {'h': 1, 'd': 2, 'c': 3, 's': 4}
+
+# Board-texture flag bits (one int instead of a six-bool dict per decision)
+TEX_PAIRED, TEX_MONOTONE, TEX_TWOTONE, TEX_STRAIGHTY, TEX_DRY, TEX_WET = 1, 2, 4, 8, 16, 32
+_TEX_POLAR = TEX_PAIRED | TEX_MONOTONE | TEX_STRAIGHTY
+
+# Blocker kind codes for the Blocker signal below
+BLOCKER_NONE, BLOCKER_FLUSH, BLOCKER_STRAIGHT = 0, 1, 2
+
+
+class Blocker(NamedTuple):
+    """Blocker signal; only three values exist, shared as module
+    singletons so the classifier never allocates per decision."""
+    has: bool
+    kind: int
+
+
+_NO_BLOCKER = Blocker(False, BLOCKER_NONE)
+_FLUSH_BLOCKER = Blocker(True, BLOCKER_FLUSH)
+_STRAIGHT_BLOCKER = Blocker(True, BLOCKER_STRAIGHT)
+
+# ord()-indexed table for the common single-character spellings: a list
+# index beats a dict probe and covers '2'..'9' plus T/J/Q/K/A either case.
+_RANK_ORD_LUT = [0] * 128
+for _ch, _v in _RANK_MAP.items():
+    if isinstance(_ch, str) and len(_ch) == 1:
+        _RANK_ORD_LUT[ord(_ch)] = _v
+del _ch, _v
+
+
+@lru_cache(maxsize=16)
+def _pos_table(n: int) -> Tuple[str, ...]:
+    """rel-seat -> EP/MP/LP/BLIND labels for an n-player table; the bucket
+    arithmetic is constant per n, so run it once and index thereafter."""
+    out = []
+    ep_hi = max(2, n // 3)
+    mp_hi = max(3, (2 * n) // 3)
+    for rel in range(n):
+        if rel <= 1:
+            out.append("BLIND")
+        elif rel <= ep_hi:
+            out.append("EP")
+        elif rel <= mp_hi:
+            out.append("MP")
+        else:
+            out.append("LP")
+    return tuple(out)
+
+
+def _build_jam_gates() -> Dict[Tuple[int, int, bool], float]:
+    """Push/fold chart: (hi, lo, in LP/MP) -> rng gate (0 never, 1 always).
+
+    Precomputed from the jam heuristic's rules so the per-decision check is
+    one dict probe and one compare.
+    """
+    gates = {}
+    for hi in range(2, 15):
+        for lo in range(2, hi + 1):
+            for lp_mp in (False, True):
+                if hi == lo:
+                    g = 1.0 if hi >= 11 else (0.8 if hi >= 9 else 0.0)
+                elif hi == 14 and lo >= 12:
+                    g = 1.0
+                elif lo >= 12:
+                    g = 0.7 if lp_mp else 0.45
+                else:
+                    g = 0.0
+                if g:
+                    gates[(hi, lo, lp_mp)] = g
+    return gates
+
+
+_JAM_GATES = _build_jam_gates()
+
+
+@lru_cache(maxsize=8)
+def _passive_caps(sb: int) -> Tuple[int, int]:
+    """(buy-in cap, pot cap) for the passive-table heuristic; blinds are
+    fixed within a level, so derive both thresholds once per small blind."""
+    return max(4 * sb, 20), (20 * sb if sb > 0 else 200)
+
+
+@lru_cache(maxsize=8)
+def _gid_crc(gid: str) -> int:
+    """crc32 of the game id; constant per game, so hash it once per game
+    instead of once per decision."""
+    return crc32(gid.encode('utf-8'))
 
 # Reuse your helpers if available
 from src.models.cards import is_pair, both_high, has_pair_with_board
@@ -26,6 +128,7 @@ class KillerInstinctStrategy(Strategy):
     PREFLOP_OPEN_MIN_RAISE_MULT = 1.0    # open baseline (min-raise * this)
     PREFLOP_PAIR_RAISE_EXTRA = 0.5       # add 0.5x min-raise for pocket pairs when deep
     JAM_BB_THRESHOLD = 10                # push/fold mode if effective stack <= 10 BB
+    OPEN_GATE = {"EP": 0.40, "MP": 0.55, "BLIND": 0.30}  # rng open gates; LP is multiway-dependent
 
     # Postflop sizings
     CBET_SMALL_FRAC = 0.33               # 1/3 pot c-bet on dry boards
@@ -43,92 +146,158 @@ class KillerInstinctStrategy(Strategy):
     TIGHTEN_VS_BIG_SIZING = True         # fold more when price is bad and we’re capped
     PUNISH_PASSIVES = True               # add extra thin value vs callers (heuristic)
 
+    def __init__(self) -> None:
+        super().__init__()
+        # Partial-evaluated sizing closures: the pot fractions are class
+        # constants, so fold each into its own small function once here
+        # instead of threading them through _size_from_pot per call.
+        def _sizer(f: float, cap_frac: float = 1.0):
+            def _size(pot: int, stack: int) -> int:
+                amt = int(max(1, pot * f))
+                cap = int(stack * cap_frac)
+                return max(1, min(amt, cap))
+            return _size
+        self._size_cbet = _sizer(self.CBET_SMALL_FRAC)
+        self._size_value = _sizer(self.VALUE_RAISE_FRAC)
+        self._size_polar = _sizer(self.POLAR_OVERBET_FRAC, self.MAX_OVERBET_STACK_FRAC)
+        # Pot-odds threshold as an integer percentage for _price_ok
+        self._price_pct = int(round(self.POT_ODDS_CALL_THRESHOLD * 100))
+
     # -------------- Public entrypoint --------------
     def decide_bet(self, game_state: Dict[str, Any]) -> int:
+        parsed = self._safe_parse(game_state)
+        return 0 if parsed is None else self._decide(parsed)
+
+    def _safe_parse(self, game_state: Dict[str, Any]) -> Optional[Tuple[Any, ...]]:
+        """Validate the state and extract every feature the decision needs.
+
+        Returns None for malformed input or a busted stack (both fold).
+        All exception handling lives here, so _decide runs without a try
+        frame on the hot path.
+        """
         try:
-            # --- Defensive parse ---
-            players = game_state.get('players') or []
-            in_action = int(game_state.get('in_action', 0) or 0)
+            # Destructure the state in one pass instead of interleaving
+            # .get() calls through the body: every key is hashed exactly once.
+            gs = game_state.get
+            (players, in_action, board, current_buy_in, minimum_raise, pot,
+             small_blind, gid, rnd, bet_index, dealer) = (
+                gs('players') or [], int(gs('in_action', 0) or 0),
+                gs('community_cards') or [], self._to_int(gs('current_buy_in')),
+                self._to_int(gs('minimum_raise')), self._to_int(gs('pot')),
+                self._to_int(gs('small_blind')), str(gs('game_id', '')),
+                int(gs('round', 0) or 0), int(gs('bet_index', 0) or 0),
+                int(gs('dealer', 0) or 0))
             me = players[in_action] if 0 <= in_action < len(players) else {}
 
             hole = me.get('hole_cards') or []
-            board = game_state.get('community_cards') or []
+            # The card helpers downstream assume dict cards; reject anything
+            # else here instead of catching it mid-decision.
+            for c in hole:
+                if not isinstance(c, dict):
+                    return None
+            for c in board:
+                if not isinstance(c, dict):
+                    return None
 
-            current_buy_in = self._to_int(game_state.get('current_buy_in'))
-            minimum_raise = self._to_int(game_state.get('minimum_raise'))
             my_bet = self._to_int(me.get('bet'))
             my_stack = self._to_int(me.get('stack'))
-            pot = self._to_int(game_state.get('pot'))
-            small_blind = self._to_int(game_state.get('small_blind'))
             big_blind = max(1, small_blind * 2)
 
             to_call = max(0, current_buy_in - my_bet)
             if my_stack <= 0:
-                return 0  # busted
+                return None  # busted
 
             # Deterministic RNG (reproducible across reruns of the same state)
-            rng = self._rng(game_state, in_action)
+            rng = self._rng(gid, rnd, bet_index, in_action)
 
             # Streets / position / stacks
             street = self._street(board)                            # preflop/flop/turn/river
-            pos_cat = self._position_category(game_state, in_action)  # EP/MP/LP/BLIND
-            spr = self._spr(my_stack, pot, to_call)
-            eff_bb = self._eff_bb(my_stack, big_blind)
-
-            # Hand & board features
+            pos_cat = self._position_category(len(players), dealer, in_action)
+            # Integer forms of the stack-depth tests: the jam layer only
+            # asks eff_bb <= threshold and postflop only asks spr <= 3, so
+            # cross-multiply instead of float-dividing every decision.
+            short_stack = my_stack <= self.JAM_BB_THRESHOLD * big_blind
+            spr_low = max(1, my_stack - to_call) <= 3 * max(1, pot + to_call)
+
+            # Hand & board features (cards parsed once, tuples passed down)
+            hole_rs = self._parse_cards(hole)
+            board_rs = self._parse_cards(board)
             pocket_pair = is_pair(hole)
             decent = both_high(hole, threshold=12) or has_pair_with_board(hole, board)
-            texture = self._board_texture(board)
-            have_blocker, blocker_type = self._blocker_signal(hole, board, texture)
-
-            # Opponent model (very light):
-            opp_count = sum(1 for p in players if (p or {}).get('status') == 'active') or 2
-            multiway = opp_count > 2
-            exploit_vs_callers = self.PUNISH_PASSIVES and self._table_looks_passive(players, game_state)
-
-            # ------ Decision skeleton ------
-            desired = 0
-
-            if street == "preflop":
-                # Short‑stack jam layer first
-                if eff_bb <= self.JAM_BB_THRESHOLD:
-                    if self._is_preflop_jam_candidate(hole, pos_cat, rng):
-                        # all-in (amount to add now is entire stack)
-                        desired = my_stack
-                    else:
-                        # call if cheap / good price, otherwise fold
-                        cheap_call_limit = self._cheap_call_limit(my_stack)
-                        if self._price_ok(to_call, pot) or to_call <= cheap_call_limit:
-                            desired = min(to_call, my_stack)
-                        else:
-                            desired = 0
+            texture, suit_tally = self._board_texture(board_rs)
+            blocker = self._blocker_signal(hole_rs, suit_tally, texture)
+
+            # Opponent model (very light): plain loop, no generator frame
+            opp_count = 0
+            for p in players:
+                if (p or {}).get('status') == 'active':
+                    opp_count += 1
+            multiway = (opp_count or 2) > 2
+            exploit_vs_callers = self.PUNISH_PASSIVES and self._table_looks_passive(
+                pot, current_buy_in, small_blind)
+
+            # Price / cheap-peel checks are pure in (to_call, pot, stack):
+            # evaluate once here instead of in each plan that consults them.
+            price_ok = self._price_ok(to_call, pot)
+            cheap_call_limit = self._cheap_call_limit(my_stack)
+        except Exception:
+            # Fail-safe: never crash the round
+            return None
+
+        return (street, pos_cat, short_stack, spr_low, rng, hole, board,
+                texture, pocket_pair, decent, to_call, minimum_raise,
+                my_stack, pot, small_blind, blocker, multiway,
+                exploit_vs_callers, price_ok, cheap_call_limit)
+
+    def _decide(self, parsed: Tuple[Any, ...]) -> int:
+        """Decision skeleton over pre-validated features; exception-free."""
+        (street, pos_cat, short_stack, spr_low, rng, hole, board,
+         texture, pocket_pair, decent, to_call, minimum_raise,
+         my_stack, pot, small_blind, blocker, multiway,
+         exploit_vs_callers, price_ok, cheap_call_limit) = parsed
+
+        desired = 0
+
+        if street == "preflop":
+            # Short‑stack jam layer first
+            if short_stack:
+                if self._is_preflop_jam_candidate(hole, pos_cat, rng):
+                    # all-in (amount to add now is entire stack)
+                    desired = my_stack
                 else:
-                    desired = self._preflop_plan(
-                        pocket_pair=pocket_pair,
-                        decent=decent,
-                        pos_cat=pos_cat,
-                        to_call=to_call,
-                        minimum_raise=minimum_raise,
-                        stack=my_stack,
-                        pot=pot,
-                        spr=spr,
-                        rng=rng,
-                        multiway=multiway,
-                        small_blind=small_blind
-                    )
+                    # call if cheap / good price, otherwise fold
+                    if price_ok or to_call <= cheap_call_limit:
+                        desired = min(to_call, my_stack)
+                    else:
+                        desired = 0
             else:
-                desired = self._postflop_plan(
-                    hole, board, texture, pocket_pair, decent,
-                    to_call, minimum_raise, my_stack, pot, spr, rng,
-                    have_blocker, blocker_type, multiway, exploit_vs_callers
+                desired = self._preflop_plan(
+                    pocket_pair=pocket_pair,
+                    decent=decent,
+                    pos_cat=pos_cat,
+                    to_call=to_call,
+                    minimum_raise=minimum_raise,
+                    stack=my_stack,
+                    pot=pot,
+                    rng=rng,
+                    multiway=multiway,
+                    small_blind=small_blind,
+                    price_ok=price_ok,
+                    cheap_call_limit=cheap_call_limit
                 )
-
-            # --- Legality + clamps ---
-            return self._finalize(desired, to_call, minimum_raise, my_stack)
-
-        except Exception:
-            # Fail-safe: never crash the round
-            return 0
+        else:
+            desired = self._postflop_plan(
+                hole, board, texture, pocket_pair, decent,
+                to_call, minimum_raise, my_stack, pot, spr_low, rng,
+                blocker, multiway, exploit_vs_callers,
+                price_ok, cheap_call_limit
+            )
+
+        # --- Legality + clamps ---
+        if desired <= to_call:
+            # Fold/check/call amounts are already legal; skip raise re-validation
+            return self._finalize_fast(desired, to_call, my_stack)
+        return self._finalize(desired, to_call, minimum_raise, my_stack)
 
     # -----------------------------
     # PRE-FLOP
@@ -136,7 +305,8 @@ class KillerInstinctStrategy(Strategy):
     def _preflop_plan(
         self, pocket_pair: bool, decent: bool, pos_cat: str,
         to_call: int, minimum_raise: int, stack: int, pot: int,
-        spr: float, rng: float, multiway: bool, small_blind: int
+        rng: float, multiway: bool, small_blind: int,
+        price_ok: bool, cheap_call_limit: int
     ) -> int:
         """
         Position-adjusted ranges with mixed frequencies.
@@ -146,32 +316,15 @@ class KillerInstinctStrategy(Strategy):
         - Blinds: defend tighter OOP, avoid dominated offsuits unless cheap.
         - Multiway: fewer bluffs, prefer calls with playable hands when priced.
         """
-        # Opening (nobody bet yet)
+        # Opening (nobody bet yet): one gate probe instead of a branch per
+        # position; LP stays special (slightly tighter into multiway risk).
         if to_call == 0:
-            if pos_cat == "EP":
-                if pocket_pair or decent or rng < 0.40:
-                    return self._open(minimum_raise, stack, extra=(self.PREFLOP_PAIR_RAISE_EXTRA if pocket_pair else 0))
-                return 0
-            if pos_cat == "MP":
-                if pocket_pair or decent or rng < 0.55:
-                    return self._open(minimum_raise, stack, extra=(self.PREFLOP_PAIR_RAISE_EXTRA if pocket_pair else 0))
-                return 0
-            if pos_cat == "LP":
-                # Slightly tighter if many players left behind (multiway risk)
-                gate = 0.68 if multiway else 0.75
-                if pocket_pair or decent or rng < gate:
-                    return self._open(minimum_raise, stack, extra=(self.PREFLOP_PAIR_RAISE_EXTRA if pocket_pair else 0))
-                return 0
-            # Blinds: mostly complete/defend with stronger hands
-            if pos_cat == "BLIND":
-                if pocket_pair or decent or rng < 0.30:
-                    return self._open(minimum_raise, stack, extra=(self.PREFLOP_PAIR_RAISE_EXTRA if pocket_pair else 0))
-                return 0
+            gate = self.OPEN_GATE.get(pos_cat) or (0.68 if multiway else 0.75)
+            if pocket_pair or decent or rng < gate:
+                return self._open(minimum_raise, stack, extra=(self.PREFLOP_PAIR_RAISE_EXTRA if pocket_pair else 0))
+            return 0
 
         # Facing a raise: potential 3-bet / squeeze
-        cheap_call_limit = self._cheap_call_limit(stack)
-        price_ok = self._price_ok(to_call, pot)
-
         # Tighter 3-bet policy; LP > MP > EP; squeeze less often multiway
         if pocket_pair and to_call <= stack and minimum_raise > 0:
             want_3bet = ((pos_cat == "LP" and rng < 0.58) or
@@ -196,8 +349,9 @@ class KillerInstinctStrategy(Strategy):
     # -----------------------------
     def _postflop_plan(
         self, hole, board, texture, pocket_pair, decent,
-        to_call, minimum_raise, stack, pot, spr, rng,
-        have_blocker, blocker_type, multiway, exploit_vs_callers
+        to_call, minimum_raise, stack, pot, spr_low, rng,
+        blocker, multiway, exploit_vs_callers,
+        price_ok, cheap_call_limit
     ) -> int:
         """
         Balanced postflop lines:
@@ -212,49 +366,45 @@ class KillerInstinctStrategy(Strategy):
             # Value/protection when made hand (pair+)
             if has_pair_with_board(hole, board) or pocket_pair:
                 if rng < self.THIN_VALUE_FREQ:
-                    target = self._size_from_pot(pot, self.VALUE_RAISE_FRAC, stack)
+                    target = self._size_value(pot, stack)
                     return self._legal_raise_strict(0, self._min_raise_or_1(minimum_raise), stack, absolute=target)
                 return 0
 
             # Bluff/semi-bluff: dry boards more often, boost with blockers
-            bluff_freq = self.BLUFF_FREQ_DRY if texture["dry"] else self.BLUFF_FREQ_WET
-            if have_blocker:
+            bluff_freq = self.BLUFF_FREQ_DRY if texture & TEX_DRY else self.BLUFF_FREQ_WET
+            if blocker.has:
                 bluff_freq += 0.08
             if rng < bluff_freq:
-                frac = self.CBET_SMALL_FRAC if texture["dry"] else self.VALUE_RAISE_FRAC
-                target = self._size_from_pot(pot, frac, stack)
+                target = (self._size_cbet if texture & TEX_DRY else self._size_value)(pot, stack)
                 return self._legal_raise_strict(0, self._min_raise_or_1(minimum_raise), stack, absolute=target)
             return 0
 
         # Facing a bet: decide call/raise/fold
-        price_ok = self._price_ok(to_call, pot)
         has_made = has_pair_with_board(hole, board) or pocket_pair
 
         # Check-raise value when strong and SPR healthy
         if has_made and rng < 0.35:
-            small_value = self._size_from_pot(pot, self.VALUE_RAISE_FRAC, stack)
+            small_value = self._size_value(pot, stack)
             return self._promote_raise_strict(to_call, minimum_raise, stack, small_value)
 
         # Check-raise bluff with blockers at some freq
-        if have_blocker and rng < self.XR_BLUFF_FREQ and not has_made:
-            frac = self.VALUE_RAISE_FRAC if not texture["dry"] else self.CBET_SMALL_FRAC
-            blf = self._size_from_pot(pot, frac, stack)
+        if blocker.has and rng < self.XR_BLUFF_FREQ and not has_made:
+            blf = (self._size_cbet if texture & TEX_DRY else self._size_value)(pot, stack)
             return self._promote_raise_strict(to_call, minimum_raise, stack, blf)
 
         # Polar overbet when board texture allows & SPR low
-        if has_made and self._polar_friendly(texture) and spr <= 3 and rng < 0.35:
-            over = self._size_from_pot(pot, self.POLAR_OVERBET_FRAC, stack, cap_stack_frac=self.MAX_OVERBET_STACK_FRAC)
+        if has_made and self._polar_friendly(texture) and spr_low and rng < 0.35:
+            over = self._size_polar(pot, stack)
             return self._promote_raise_strict(to_call, minimum_raise, stack, over)
 
         # Calls: priced-in or cheap peels (widen vs passives)
-        cheap_call_limit = self._cheap_call_limit(stack)
         if price_ok or to_call <= cheap_call_limit:
-            if exploit_vs_callers and (decent or has_made or texture["wet"]):
+            if exploit_vs_callers and (decent or has_made or texture & TEX_WET):
                 return min(to_call, stack)
             return min(to_call, stack)
 
         # Tighten vs big sizing when capped & no blockers
-        if self.TIGHTEN_VS_BIG_SIZING and not has_made and not have_blocker:
+        if self.TIGHTEN_VS_BIG_SIZING and not has_made and not blocker.has:
             return 0
 
         return 0
@@ -264,6 +414,10 @@ class KillerInstinctStrategy(Strategy):
     # -----------------------------
     @staticmethod
     def _to_int(x: Optional[Any]) -> int:
+        # Protocol values arrive as plain ints from JSON; take that path
+        # without setting up an exception handler.
+        if type(x) is int:
+            return x if x > 0 else 0
         try:
             v = int(x or 0)
             return max(0, v)
@@ -290,79 +444,84 @@ class KillerInstinctStrategy(Strategy):
             return 999.0
         return stack / float(big_blind)
 
-    def _position_category(self, gs: Dict[str, Any], in_action: int) -> str:
+    def _position_category(self, n: int, dealer: int, in_action: int) -> str:
         """Approximate: EP/MP/LP/BLIND based on dealer index."""
-        dealer = int(gs.get('dealer', 0) or 0)
-        players = gs.get('players') or []
-        n = len(players)
         if n <= 0: return "EP"
-        # relative seat from button
-        rel = (in_action - dealer - 1) % n  # 0=SB,1=BB,2=UTG...
-        if rel == 0 or rel == 1:
-            return "BLIND"
-        # coarse buckets
-        if rel <= max(2, n // 3):
-            return "EP"
-        if rel <= max(3, (2 * n) // 3):
-            return "MP"
-        return "LP"
-
-    def _board_texture(self, board: list) -> Dict[str, bool]:
-        """Classify texture: dry, wet, paired, monotone, straighty."""
-        suits = [c.get('suit') for c in (board or [])]
-        ranks = [self._rank_to_int(c.get('rank')) for c in (board or []) if c.get('rank')]
-
-        paired = len(ranks) != len(set(ranks))
-        suit_counts = {}
-        for s in suits:
-            if not s: continue
-            suit_counts[s] = suit_counts.get(s, 0) + 1
-        monotone = any(cnt >= 3 for cnt in suit_counts.values())
-        twotone = any(cnt == 2 for cnt in suit_counts.values())
-
-        # crude straightiness: any 3-in-a-row on board
-        ranks = sorted(set(ranks))
-        straighty = any(all((r + i) in ranks for i in range(3)) for r in ranks)
-
-        dry = (not paired) and (not monotone) and (not straighty) and (not twotone)
-        wet = monotone or straighty or (twotone and not paired)
-
-        return {
-            "paired": paired,
-            "monotone": monotone,
-            "twotone": twotone,
-            "straighty": straighty,
-            "dry": dry,
-            "wet": wet
-        }
+        # relative seat from button, then one probe into the frozen rel ->
+        # category table for this table size
+        return _pos_table(n)[(in_action - dealer - 1) % n]  # rel 0=SB,1=BB,2=UTG...
+
+    def _parse_cards(self, cards: list) -> Tuple[int, ...]:
+        """Parse card dicts once into packed ints (rank << 3 | suit code)
+        for the feature helpers; suit code 0 marks an unknown suit."""
+        return tuple((self._rank_to_int((c or {}).get('rank')) << 3)
+                     | _SUIT_CODE.get(((c or {}).get('suit') or '')[:1], 0)
+                     for c in (cards or []))
+
+    def _board_texture(self, board: Tuple[int, ...]) -> Tuple[int, list]:
+        """Classify texture into a TEX_* flag bitfield.
+
+        One pass over the packed cards fills a 5-slot suit tally and a rank
+        bitmask (plus a duplicate flag) instead of list/set/dict rebuilds.
+        Returns (flags, suit tally) so the blocker check can reuse the
+        tally without a second counting pass.
+        """
+        tally = [0, 0, 0, 0, 0]
+        m = 0
+        paired = False
+        for c in board:
+            r = c >> 3
+            if r:
+                bit = 1 << r
+                if m & bit:
+                    paired = True
+                m |= bit
+            tally[c & 7] += 1
+        monotone = max(tally[1:]) >= 3
+        twotone = 2 in tally[1:]
+
+        # crude straightiness: any 3-in-a-row on board, via the rank mask
+        # (three shifted ANDs); an ace also counts low so A-2-3 registers.
+        if m & (1 << 14):
+            m |= 1 << 1
+        straighty = bool(m & (m >> 1) & (m >> 2))
+
+        flags = 0
+        if paired: flags |= TEX_PAIRED
+        if monotone: flags |= TEX_MONOTONE
+        if twotone: flags |= TEX_TWOTONE
+        if straighty: flags |= TEX_STRAIGHTY
+        if not flags: flags = TEX_DRY
+        if monotone or straighty or (twotone and not paired): flags |= TEX_WET
+        return flags, tally
 
     @staticmethod
     def _rank_to_int(r: Optional[str]) -> int:
-        mapping = {'J': 11, 'Q': 12, 'K': 13, 'A': 14}
-        if not r: return 0
-        try:
-            return int(r)
-        except Exception:
-            return mapping.get(str(r).upper(), 0)
+        if r.__class__ is str and len(r) == 1:
+            c = ord(r)
+            return _RANK_ORD_LUT[c] if c < 128 else 0
+        return _RANK_MAP.get(r, 0) if r else 0
 
-    def _blocker_signal(self, hole: list, board: list, texture: Dict[str, bool]) -> Tuple[bool, Optional[str]]:
+    def _blocker_signal(self, hole: Tuple[int, ...], suit_tally: list,
+                        texture: int) -> Blocker:
         """Detect classic blocker spots: ace-of-suit on monotone; broadway blockers on straighty."""
         if not hole:
-            return False, None
-        # Suited A/K blocker on monotone boards
-        if texture.get("monotone"):
-            board_suits = [c.get('suit') for c in (board or [])]
-            if len(board_suits) >= 3:
-                mono_suit = max(set(board_suits), key=board_suits.count)
+            return _NO_BLOCKER
+        # Suited A/K blocker on monotone boards; majority suit straight
+        # from the tally _board_texture already filled.
+        if texture & TEX_MONOTONE:
+            best = max(suit_tally[1:])
+            if best >= 3:
+                mono_suit = 1 + suit_tally[1:].index(best)
                 for c in hole:
-                    if c.get('suit') == mono_suit and c.get('rank') in ('A', 'K'):
-                        return True, "flush_blocker"
+                    if (c & 7) == mono_suit and (c >> 3) >= 13:
+                        return _FLUSH_BLOCKER
         # Broadway blockers on straighty boards
-        if texture.get("straighty"):
-            hole_ranks = {self._rank_to_int(c.get('rank')) for c in hole}
-            if 14 in hole_ranks or 13 in hole_ranks:
-                return True, "straight_blocker"
-        return False, None
+        if texture & TEX_STRAIGHTY:
+            for c in hole:
+                if (c >> 3) >= 13:
+                    return _STRAIGHT_BLOCKER
+        return _NO_BLOCKER
 
     def _is_preflop_jam_candidate(self, hole: list, pos_cat: str, rng: float) -> bool:
         """
@@ -371,25 +530,12 @@ class KillerInstinctStrategy(Strategy):
         - Jam AKo/AQs+ always; AJo/KQo some freq (LP/MP more than EP).
         Uses only hole ranks (no external evaluator).
         """
-        # Map ranks
+        # Map ranks, then one probe into the precomputed jam chart
         r = sorted([self._rank_to_int(c.get('rank')) for c in (hole or [])], reverse=True)
         if len(r) < 2:
             return False
-        hi, lo = r[0], r[1]
-        pair = hi == lo
-
-        # Always jam strong pairs & big aces
-        if pair and hi >= 9 + 2:  # pair >= 11 -> JJ+; treat 99-TT as frequent jams
-            return True
-        if pair and hi >= 9:      # 99, TT
-            return rng < 0.8
-        if hi == 14 and lo >= 12: # AKo, AQo+
-            return True
-        # Suited broadways & KQ/AJ mixing by position
-        if both_high(hole, threshold=12):  # both >= Q
-            gate = 0.7 if pos_cat in ("LP", "MP") else 0.45
-            return rng < gate
-        return False
+        gate = _JAM_GATES.get((r[0], r[1], pos_cat == "LP" or pos_cat == "MP"), 0.0)
+        return rng < gate
 
     # ---------- Sizing helpers ----------
     def _size_from_pot(self, pot: int, frac: float, stack: int, cap_stack_frac: float = 1.0) -> int:
@@ -422,11 +568,10 @@ class KillerInstinctStrategy(Strategy):
         if minimum_raise <= 0:
             return min(to_call, stack)  # cannot raise; call/check
 
-        legal_min_exclusive = to_call + minimum_raise
-        target = legal_min_exclusive + 1 + (bump if bump else 0)  # +1 enforces strictness
-        if absolute is not None:
-            target = max(legal_min_exclusive + 1, absolute)
-        return min(max(legal_min_exclusive + 1, target), stack)
+        # +1 enforces strictness; computed once and reused below
+        legal_min_plus1 = to_call + minimum_raise + 1
+        target = absolute if absolute is not None else legal_min_plus1 + bump
+        return min(max(legal_min_plus1, target), stack)
 
     def _promote_raise_strict(self, to_call: int, minimum_raise: int, stack: int, target_total: int) -> int:
         """
@@ -434,8 +579,7 @@ class KillerInstinctStrategy(Strategy):
         """
         if minimum_raise <= 0 or stack <= to_call:
             return min(to_call, stack)
-        legal_min_exclusive = to_call + minimum_raise
-        return min(max(legal_min_exclusive + 1, target_total), stack)
+        return min(max(to_call + minimum_raise + 1, target_total), stack)
 
     # ---------- Price / peels ----------
     def _price_ok(self, to_call: int, pot: int) -> bool:
@@ -444,26 +588,32 @@ class KillerInstinctStrategy(Strategy):
         denom = pot + to_call
         if denom <= 0:
             return to_call <= 1
-        return (to_call / float(denom)) <= self.POT_ODDS_CALL_THRESHOLD
+        # Integer cross-multiply of to_call/denom <= threshold; the percent
+        # numerator is frozen from the tunable in __init__.
+        return to_call * 100 <= self._price_pct * denom
 
     def _cheap_call_limit(self, stack: int) -> int:
         pct_cap = int(stack * self.CHEAP_CALL_STACK_PCT)
         return max(1, min(pct_cap, self.CHEAP_CALL_ABS_CAP))
 
     # ---------- Texture helpers ----------
-    def _polar_friendly(self, texture: Dict[str, bool]) -> bool:
+    def _polar_friendly(self, texture: int) -> bool:
         # Paired or clearly monotone/straighty boards play well for polarized pressure
-        return texture.get("paired") or texture.get("monotone") or texture.get("straighty")
+        return bool(texture & _TEX_POLAR)
 
-    def _table_looks_passive(self, players: list, gs: Dict[str, Any]) -> bool:
+    def _table_looks_passive(self, pot: int, current_buy_in: int, sb: int) -> bool:
         """
         Rough passive table heuristic: if current_buy_in is near SB levels late in betting
-        and pots stay small multiway, bias toward value vs callers.
+        and pots stay small multiway, bias toward value vs callers. Takes the
+        ints decide_bet already coerced; the caps are frozen per blind level.
         """
-        pot = self._to_int(gs.get('pot'))
-        current_buy_in = self._to_int(gs.get('current_buy_in'))
-        sb = self._to_int(gs.get('small_blind'))
-        return (current_buy_in <= max(4 * sb, 20)) and (pot <= 20 * sb if sb > 0 else pot <= 200)
+        buyin_cap, pot_cap = _passive_caps(sb)
+        return current_buy_in <= buyin_cap and pot <= pot_cap
+
+    def _finalize_fast(self, desired: int, to_call: int, stack: int) -> int:
+        """Clamp-only path for fold/check/call amounts the caller already validated."""
+        desired = max(0, min(int(desired or 0), stack))
+        return 0 if desired < to_call else desired
 
     def _finalize(self, desired: int, to_call: int, minimum_raise: int, stack: int) -> int:
         """
@@ -488,8 +638,19 @@ class KillerInstinctStrategy(Strategy):
             return min(to_call, stack)
         return desired
 
-    # Deterministic RNG in [0,1)
-    def _rng(self, gs: Dict[str, Any], in_action: int) -> float:
-        key = f"{gs.get('game_id','')}-{gs.get('round',0)}-{gs.get('bet_index',0)}-{in_action}"
-        h = hashlib.sha256(key.encode('utf-8')).hexdigest()
-        return int(h[:8], 16) / 0xFFFFFFFF
+    # Deterministic RNG in [0,1): SplitMix64 finalizer over the four seed
+    # fields. The game_id goes through crc32 (stable across processes,
+    # unlike hash()); everything else is integer mixing — no SHA-256 on
+    # the per-decision path.
+    def _rng(self, gid: str, rnd: int, bet_index: int, in_action: int) -> float:
+        mask = 0xFFFFFFFFFFFFFFFF
+        k = ((_gid_crc(gid) & mask)
+             ^ (rnd * 0x9E3779B97F4A7C15)
+             ^ (bet_index * 0xBF58476D1CE4E5B9)
+             ^ (in_action * 0x94D049BB133111EB)) & mask
+        k ^= k >> 30
+        k = (k * 0xBF58476D1CE4E5B9) & mask
+        k ^= k >> 27
+        k = (k * 0x94D049BB133111EB) & mask
+        k ^= k >> 31
+        return (k >> 40) / float(1 << 24)